@@ -4,6 +4,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from browser_scraper_pool.api import (
+    PoolDep,
     contexts_router,
     pool_router,
     scrape_router,
@@ -52,9 +53,8 @@ async def root():
 
 
 @app.get("/healthz", tags=["root"])
-async def healthz():
+async def healthz(pool: PoolDep):
     """Health check endpoint."""
-    pool: ContextPool = app.state.context_pool
     return {
         "status": "ok",
         "contexts": pool.size,
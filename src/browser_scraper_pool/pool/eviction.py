@@ -1,12 +1,18 @@
 """Eviction strategy for context pool management."""
 
 from datetime import UTC, datetime
+from functools import partial
 
 from browser_scraper_pool.config import settings
 from browser_scraper_pool.pool.context_pool import ContextInstance
 
+# Contexts carrying this tag are never evicted
+PROTECTED_TAG = "protected"
 
-def calculate_eviction_score(ctx: ContextInstance) -> float:
+
+def calculate_eviction_score(
+    ctx: ContextInstance, *, now: datetime | None = None
+) -> float:
     """Calculate eviction score for a context.
 
     Higher score = more likely to evict.
@@ -20,15 +26,18 @@ def calculate_eviction_score(ctx: ContextInstance) -> float:
 
     Args:
         ctx: The context to score.
+        now: Reference time for idle and age. Defaults to the current time;
+            pass one value when scoring several contexts so they compare fairly.
 
     Returns:
         Eviction score. Higher means more evictable. -inf means never evict.
     """
     # Never evict protected or in-use contexts
-    if ctx.in_use or "protected" in ctx.tags:
+    if ctx.in_use or PROTECTED_TAG in ctx.tags:
         return float("-inf")
 
-    now = datetime.now(UTC)
+    if now is None:
+        now = datetime.now(UTC)
 
     # Calculate idle time in seconds
     if ctx.last_used_at:
@@ -64,34 +73,31 @@ def find_eviction_candidate(
     Returns:
         The context with highest eviction score, or None if none can be evicted.
     """
-    best_candidate: ContextInstance | None = None
-    best_score = float("-inf")
-
-    for ctx in contexts.values():
-        # Skip if has excluded tags
-        if exclude_tags and ctx.tags & exclude_tags:
-            continue
-
-        score = calculate_eviction_score(ctx)
-
-        # Skip unevictable contexts (protected, in_use)
-        if score == float("-inf"):
-            continue
-
-        if score > best_score:
-            best_score = score
-            best_candidate = ctx
-
-    return best_candidate
+    # Protected and excluded tags are one disjointness check per context,
+    # which stops at the first shared tag and builds no intersection set
+    blocked_tags = {PROTECTED_TAG, *(exclude_tags or ())}
+    # Filter unevictable contexts (in use, protected, excluded) before scoring
+    evictable = (
+        ctx
+        for ctx in contexts.values()
+        if not ctx.in_use and ctx.tags.isdisjoint(blocked_tags)
+    )
+    # One timestamp for the whole scan keeps scores comparable
+    score = partial(calculate_eviction_score, now=datetime.now(UTC))
+    return max(evictable, key=score, default=None)
 
 
-def should_recreate(ctx: ContextInstance) -> bool:
+def should_recreate(ctx: ContextInstance, threshold: int | None = None) -> bool:
     """Check if context should be recreated due to errors.
 
     Args:
         ctx: The context to check.
+        threshold: Consecutive errors that trigger recreation. Defaults to
+            settings.max_consecutive_errors.
 
     Returns:
         True if context should be recreated (too many consecutive errors).
     """
-    return ctx.consecutive_errors >= settings.max_consecutive_errors
+    if threshold is None:
+        threshold = settings.max_consecutive_errors
+    return ctx.consecutive_errors >= threshold
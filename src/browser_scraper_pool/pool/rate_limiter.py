@@ -1,7 +1,8 @@
 """Domain rate limiting for browser contexts."""
 
+import time
+from collections.abc import Callable
 from datetime import UTC, datetime
-from urllib.parse import urlparse
 
 from browser_scraper_pool.pool.context_pool import ContextInstance
 
@@ -11,15 +12,25 @@ class DomainRateLimiter:
 
     Each context tracks when it last made a request to each domain.
     This prevents hammering the same domain from a single context.
+
+    Timestamps are ``time.monotonic()`` seconds, so checks are plain float
+    arithmetic and unaffected by wall-clock adjustments.
     """
 
-    def __init__(self, default_delay_ms: int = 1000) -> None:
+    def __init__(
+        self,
+        default_delay_ms: int = 1000,
+        time_func: Callable[[], float] = time.monotonic,
+    ) -> None:
         """Initialize rate limiter.
 
         Args:
             default_delay_ms: Default delay between requests to same domain (milliseconds).
+            time_func: Clock returning monotonic seconds. Tests can pass a fake
+                clock to step over delays without sleeping.
         """
         self.default_delay_ms = default_delay_ms
+        self._time_func = time_func
 
     def can_request(
         self,
@@ -43,7 +54,7 @@ class DomainRateLimiter:
         if last_request is None:
             return True
 
-        elapsed_ms = (datetime.now(UTC) - last_request).total_seconds() * 1000
+        elapsed_ms = (self._time_func() - last_request) * 1000
         return elapsed_ms >= delay
 
     def record_request(self, ctx: ContextInstance, domain: str) -> None:
@@ -53,7 +64,7 @@ class DomainRateLimiter:
             ctx: The context making the request.
             domain: The domain being requested.
         """
-        ctx.domain_last_request[domain] = datetime.now(UTC)
+        ctx.domain_last_request[domain] = self._time_func()
         ctx.last_used_at = datetime.now(UTC)
         ctx.total_requests += 1
 
@@ -79,7 +90,7 @@ class DomainRateLimiter:
         if last_request is None:
             return 0.0
 
-        elapsed_ms = (datetime.now(UTC) - last_request).total_seconds() * 1000
+        elapsed_ms = (self._time_func() - last_request) * 1000
         remaining_ms = delay - elapsed_ms
 
         if remaining_ms <= 0:
@@ -114,5 +125,18 @@ class DomainRateLimiter:
         Returns:
             Domain (e.g., "www.example.com").
         """
-        parsed = urlparse(url)
-        return parsed.netloc or parsed.path.split("/")[0]
+        # Hand-rolled split: called for every scrape, and only the netloc is
+        # needed, so skip urlparse's full parse and result tuple
+        sep = url.find("://")
+        if sep != -1 and not any(ch in url[:sep] for ch in "/?#"):
+            start = sep + 3
+        elif url.startswith("//"):
+            start = 2
+        else:
+            start = 0
+        end = len(url)
+        for ch in "/?#":
+            i = url.find(ch, start, end)
+            if i != -1:
+                end = i
+        return url[start:end]
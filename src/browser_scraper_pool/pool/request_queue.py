@@ -1,11 +1,13 @@
 """Internal request queue for context allocation."""
 
 import asyncio
+import itertools
 import logging
+import secrets
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
-from uuid import uuid4
 
 from browser_scraper_pool.config import settings
 
@@ -14,13 +16,19 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class QueuedRequest:
-    """Request waiting for a context."""
+    """Request waiting for a context.
+
+    ``created_at`` is the wall-clock enqueue time for logs; expiry is computed
+    from ``created_at_mono`` (``time.monotonic()`` seconds) so the per-tick
+    cleanup is float arithmetic only.
+    """
 
     id: str
     tags: set[str]
     domain: str
     domain_delay_ms: int | None
     created_at: datetime
+    created_at_mono: float
     future: asyncio.Future[Any]
 
     @classmethod
@@ -36,23 +44,25 @@ class QueuedRequest:
         except RuntimeError:
             loop = asyncio.new_event_loop()
         return cls(
-            id=str(uuid4()),
+            # Internal-only ID, so skip building and formatting a UUID object
+            id=secrets.token_hex(16),
             tags=tags or set(),
             domain=domain or "",
             domain_delay_ms=domain_delay_ms,
             created_at=datetime.now(UTC),
+            created_at_mono=time.monotonic(),
             future=loop.create_future(),
         )
 
     def is_expired(self) -> bool:
         """Check if request has exceeded max wait time."""
-        elapsed = (datetime.now(UTC) - self.created_at).total_seconds()
+        elapsed = time.monotonic() - self.created_at_mono
         return elapsed >= settings.max_queue_wait_seconds
 
     def time_remaining(self) -> float:
         """Return seconds remaining before timeout."""
-        elapsed = (datetime.now(UTC) - self.created_at).total_seconds()
-        return max(0, settings.max_queue_wait_seconds - elapsed)
+        elapsed = time.monotonic() - self.created_at_mono
+        return max(0.0, settings.max_queue_wait_seconds - elapsed)
 
 
 class RequestQueue:
@@ -60,12 +70,61 @@ class RequestQueue:
 
     Requests are queued when no suitable context is available.
     A background task processes the queue when contexts become available.
+
+    Requests are indexed by ID, by tag signature (the frozenset of a request's
+    tags) and by individual tag. Lookups by ID are O(1), and matching scans
+    only the signature buckets a context can satisfy. Tags are indexed at
+    enqueue time. Unresolved requests are also tracked separately, so pending
+    lookups don't have to poll every future.
     """
 
     def __init__(self) -> None:
-        self._queue: list[QueuedRequest] = []
+        # Insertion-ordered, so iteration is FIFO
+        self._requests: dict[str, QueuedRequest] = {}
+        # Subset of _requests whose future has not been settled yet
+        self._pending: dict[str, QueuedRequest] = {}
+        # Enqueue order, used to pick the oldest match across signature buckets
+        self._seq: dict[str, int] = {}
+        self._counter = itertools.count()
+        self._by_signature: dict[frozenset[str], dict[str, QueuedRequest]] = {}
+        self._by_tag: dict[str, set[str]] = {}
         self._lock = asyncio.Lock()
 
+    def _add(self, request: QueuedRequest) -> None:
+        """Insert a request into the queue and all indexes."""
+        self._requests[request.id] = request
+        self._pending[request.id] = request
+        # Futures can also be settled outside the queue (caller timeouts)
+        request.future.add_done_callback(
+            lambda _, rid=request.id: self._pending.pop(rid, None)
+        )
+        self._seq[request.id] = next(self._counter)
+        signature = frozenset(request.tags)
+        self._by_signature.setdefault(signature, {})[request.id] = request
+        for tag in signature:
+            self._by_tag.setdefault(tag, set()).add(request.id)
+
+    def _remove(self, request_id: str) -> QueuedRequest | None:
+        """Drop a request from the queue and all indexes."""
+        request = self._requests.pop(request_id, None)
+        if request is None:
+            return None
+        self._pending.pop(request_id, None)
+        del self._seq[request_id]
+        signature = frozenset(request.tags)
+        bucket = self._by_signature.get(signature)
+        if bucket is not None:
+            bucket.pop(request_id, None)
+            if not bucket:
+                del self._by_signature[signature]
+        for tag in signature:
+            ids = self._by_tag.get(tag)
+            if ids is not None:
+                ids.discard(request_id)
+                if not ids:
+                    del self._by_tag[tag]
+        return request
+
     async def enqueue(
         self,
         tags: set[str] | None = None,
@@ -89,7 +148,7 @@ class RequestQueue:
         )
 
         async with self._lock:
-            self._queue.append(request)
+            self._add(request)
 
         logger.debug(
             "Enqueued request %s (tags=%s, domain=%s)",
@@ -110,15 +169,12 @@ class RequestQueue:
             True if removed, False if not found.
         """
         async with self._lock:
-            for i, req in enumerate(self._queue):
-                if req.id == request_id:
-                    self._queue.pop(i)
-                    return True
-        return False
+            return self._remove(request_id) is not None
 
     def get_pending(self) -> list[QueuedRequest]:
         """Get all pending requests (not yet resolved)."""
-        return [r for r in self._queue if not r.future.done()]
+        # Settled-but-not-yet-pruned futures are the only ones left to skip
+        return [r for r in self._pending.values() if not r.future.done()]
 
     def get_pending_count(self, tags: set[str] | None = None) -> int:
         """Count pending requests, optionally filtered by tags.
@@ -129,12 +185,20 @@ class RequestQueue:
         Returns:
             Number of pending requests.
         """
-        pending = self.get_pending()
         if not tags:
-            return len(pending)
+            return len(self.get_pending())
 
-        required = set(tags)
-        return sum(1 for r in pending if required.issubset(r.tags))
+        # Intersect the per-tag ID sets, smallest first
+        id_sets = sorted(
+            (self._by_tag.get(tag, set()) for tag in set(tags)),
+            key=len,
+        )
+        matching = set(id_sets[0]).intersection(*id_sets[1:])
+        return sum(
+            1
+            for rid in matching.intersection(self._pending)
+            if not self._pending[rid].future.done()
+        )
 
     async def cleanup_expired(self) -> int:
         """Remove expired requests and cancel their futures.
@@ -145,19 +209,16 @@ class RequestQueue:
         expired_count = 0
 
         async with self._lock:
-            remaining = []
-            for req in self._queue:
+            for req in list(self._pending.values()):
                 if req.is_expired() and not req.future.done():
                     req.future.set_exception(
                         TimeoutError(
                             f"Request timed out after {settings.max_queue_wait_seconds}s"
                         )
                     )
+                    self._remove(req.id)
                     expired_count += 1
                     logger.debug("Request %s expired", req.id)
-                else:
-                    remaining.append(req)
-            self._queue = remaining
 
         return expired_count
 
@@ -172,10 +233,11 @@ class RequestQueue:
             True if resolved, False if not found or already done.
         """
         async with self._lock:
-            for req in self._queue:
-                if req.id == request_id and not req.future.done():
-                    req.future.set_result(result)
-                    return True
+            req = self._requests.get(request_id)
+            if req is not None and not req.future.done():
+                req.future.set_result(result)
+                self._pending.pop(request_id, None)
+                return True
         return False
 
     async def reject(self, request_id: str, error: Exception) -> bool:
@@ -189,10 +251,11 @@ class RequestQueue:
             True if rejected, False if not found or already done.
         """
         async with self._lock:
-            for req in self._queue:
-                if req.id == request_id and not req.future.done():
-                    req.future.set_exception(error)
-                    return True
+            req = self._requests.get(request_id)
+            if req is not None and not req.future.done():
+                req.future.set_exception(error)
+                self._pending.pop(request_id, None)
+                return True
         return False
 
     def find_match(
@@ -202,6 +265,9 @@ class RequestQueue:
     ) -> QueuedRequest | None:
         """Find first queued request that matches available context.
 
+        Only signature buckets whose tags are a subset of ``available_tags``
+        are scanned; the oldest match across those buckets wins.
+
         Args:
             available_tags: Tags of the available context.
             domain: Domain the context is ready for (for rate limit check).
@@ -209,16 +275,27 @@ class RequestQueue:
         Returns:
             First matching QueuedRequest, or None.
         """
-        for req in self.get_pending():
-            # Check if context's tags satisfy request's requirements
-            if req.tags and not req.tags.issubset(available_tags):
-                continue
-            # Check domain match if specified
-            if req.domain and domain and req.domain != domain:
+        best: QueuedRequest | None = None
+        # Set operators need a set; this also dedupes for the length check
+        available_tags = frozenset(available_tags)
+        n_available = len(available_tags)
+        for signature, bucket in self._by_signature.items():
+            # Check if context's tags satisfy request's requirements. A longer
+            # signature can't be a subset, so skip it before hashing any tag.
+            if len(signature) > n_available or not signature <= available_tags:
                 continue
-            return req
-        return None
+            for req in bucket.values():
+                if req.future.done():
+                    continue
+                # Check domain match if specified
+                if req.domain and domain and req.domain != domain:
+                    continue
+                # Buckets are FIFO, so the first hit is this bucket's oldest
+                if best is None or self._seq[req.id] < self._seq[best.id]:
+                    best = req
+                break
+        return best
 
     def __len__(self) -> int:
         """Return total queue size (including resolved)."""
-        return len(self._queue)
+        return len(self._requests)
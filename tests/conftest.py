@@ -1,16 +1,121 @@
 """Shared pytest fixtures."""
 
+import asyncio
+import os
+import socket
+
 import pytest
+import pytest_asyncio
+from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from patchright.async_api import async_playwright
+
+from browser_scraper_pool.pool.context_pool import ContextPool
+
+try:
+    import uvloop
+except ImportError:  # not built for Windows
+    uvloop = None
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop where available, like uvicorn does in production."""
+    if uvloop is None:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture
+def pool_isolation():
+    """Reset the ContextPool singleton before and after a test."""
+    ContextPool.reset_instance()
+    yield
+    ContextPool.reset_instance()
+
+
+@pytest.fixture(scope="session")
+def asgi_app() -> FastAPI:
+    """The FastAPI app under test.
+
+    Imported here rather than at module level so that collection alone doesn't
+    build the app and register its routes.
+    """
+    from browser_scraper_pool.main import app  # noqa: PLC0415
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def asgi_transport(asgi_app) -> ASGITransport:
+    """ASGI transport for the app, shared by every test client.
+
+    The transport holds no per-request state, so one instance is built for
+    the session instead of one per test.
+    """
+    return ASGITransport(app=asgi_app)
 
-from browser_scraper_pool.main import app
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_client(asgi_transport):
+    """AsyncClient opened once for the whole session.
+
+    Tests using it must run on the session loop
+    (``pytest.mark.asyncio(loop_scope="session")``).
+    """
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as ac:
+        yield ac
 
 
 @pytest.fixture
-async def client():
+async def client(asgi_transport):
     """Async HTTP client for testing FastAPI endpoints."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as ac:
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as ac:
         yield ac
+
+
+@pytest.fixture(scope="session")
+def cdp_port() -> int:
+    """CDP port for real-browser tests, unique per pytest-xdist worker.
+
+    Workers are named gw0, gw1, ...; each gets 9222 + its index so parallel
+    Chrome instances don't fight over the same remote debugging port.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return 9222 + int(worker.removeprefix("gw"))
+
+
+@pytest.fixture
+def isolated_cdp_port() -> int:
+    """Free CDP port for a pool started while the worker's shared pool runs.
+
+    ``cdp_port`` stays bound by the session-wide browser. A second Chrome on it
+    can't bind DevTools but launches anyway, so CDP lookups would silently hit
+    the shared browser. The OS picks an unused port instead.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def playwright_driver():
+    """Playwright driver shared by all real-browser tests in the session.
+
+    Starting the driver spawns a Node subprocess, so it is done once and passed
+    to each ContextPool via its ``playwright`` argument.
+    """
+    playwright = await async_playwright().start()
+    yield playwright
+    await playwright.stop()
+
+
+@pytest.fixture(scope="session")
+def browser_launch_args() -> list[str]:
+    """Extra Chrome flags that trim startup work for real-browser tests."""
+    return [
+        "--disable-dev-shm-usage",
+        "--disable-gpu",
+        "--disable-extensions",
+        "--disable-background-networking",
+    ]
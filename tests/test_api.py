@@ -5,9 +5,9 @@ from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 
-from browser_scraper_pool.main import app
+from browser_scraper_pool.api import get_pool
 from browser_scraper_pool.pool.context_pool import (
     ContextInUseError,
     ContextNotAvailableError,
@@ -16,14 +16,6 @@ from browser_scraper_pool.pool.context_pool import (
 )
 
 
-@pytest.fixture(autouse=True)
-def reset_singleton():
-    """Reset singleton before and after each test."""
-    ContextPool.reset_instance()
-    yield
-    ContextPool.reset_instance()
-
-
 @pytest.fixture
 def mock_pool():
     """Create a mock pool with common methods."""
@@ -41,12 +33,12 @@ def mock_pool():
 
 
 @pytest.fixture
-async def client(mock_pool):
+async def client(mock_pool, asgi_app, asgi_transport):
     """Create test client with mocked pool."""
-    app.state.context_pool = mock_pool
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+    asgi_app.dependency_overrides[get_pool] = lambda: mock_pool
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as ac:
         yield ac
+    asgi_app.dependency_overrides.pop(get_pool, None)
 
 
 # =============================================================================
@@ -5,30 +5,24 @@ Run with: pytest tests/test_api_integration.py -v
 """
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 
-from browser_scraper_pool.main import app
 from browser_scraper_pool.pool.context_pool import ContextPool
 
-
-@pytest.fixture(autouse=True)
-def reset_singleton():
-    """Reset singleton before and after each test."""
-    ContextPool.reset_instance()
-    yield
-    ContextPool.reset_instance()
+pytestmark = [pytest.mark.integration, pytest.mark.usefixtures("pool_isolation")]
 
 
 @pytest.fixture
-async def client():
+async def client(isolated_cdp_port, asgi_app, asgi_transport):
     """Create test client with real browser pool."""
-    # Start the pool manually for testing
-    pool = ContextPool.get_instance(headless=True, use_virtual_display=False)
+    # Start the pool manually for testing, clear of the worker's shared pool
+    pool = ContextPool.get_instance(
+        headless=True, use_virtual_display=False, cdp_port=isolated_cdp_port
+    )
     await pool.start()
-    app.state.context_pool = pool
+    asgi_app.state.context_pool = pool
 
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as ac:
         yield ac
 
     await pool.stop()
@@ -42,7 +36,7 @@ async def client():
 class TestPoolIntegration:
     """Integration tests for pool endpoints."""
 
-    async def test_pool_status(self, client):
+    async def test_pool_status(self, client, isolated_cdp_port):
         """Should return real pool status."""
         response = await client.get("/pool/status")
 
@@ -51,7 +45,7 @@ class TestPoolIntegration:
         assert data["size"] == 0
         assert data["available"] == 0
         assert data["is_started"] is True
-        assert data["cdp_port"] == 9222
+        assert data["cdp_port"] == isolated_cdp_port
 
     async def test_cdp_endpoint(self, client):
         """Should return valid CDP endpoint."""
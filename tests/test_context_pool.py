@@ -1,8 +1,8 @@
 """Unit tests for ContextPool with mocked Playwright."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import MagicMock, patch
 
-import httpx
 import pytest
 
 from browser_scraper_pool.pool.context_pool import (
@@ -15,63 +15,159 @@ from browser_scraper_pool.pool.context_pool import (
 )
 
 
-@pytest.fixture(autouse=True)
-def reset_singleton():
-    """Reset singleton before and after each test."""
-    ContextPool.reset_instance()
-    yield
-    ContextPool.reset_instance()
+class _StubResponse:
+    """Stand-in for the Chrome /json/version response."""
 
-
-@pytest.fixture
-def mock_httpx():
-    """Mock httpx.Client for CDP endpoint fetching."""
-    with patch("browser_scraper_pool.pool.context_pool.httpx") as mock:
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+    def json(self) -> dict:
+        return {
             "webSocketDebuggerUrl": "ws://127.0.0.1:9222/devtools/browser/mock-guid"
         }
-        mock_response.raise_for_status = MagicMock()
 
-        # Mock httpx.Client() context manager pattern
-        mock_client = MagicMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock.Client.return_value = mock_client
+    def raise_for_status(self) -> None:
+        pass
+
 
-        yield {"httpx": mock, "client": mock_client, "response": mock_response}
+class _StubClient:
+    """Stand-in for httpx.Client that records how it was built and used."""
+
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+        self.requested_urls: list[str] = []
+        self.close_calls = 0
+
+    def close(self) -> None:
+        self.close_calls += 1
+
+    def get(self, url: str, **kwargs) -> _StubResponse:
+        self.requested_urls.append(url)
+        return _StubResponse()
 
 
 @pytest.fixture
-def mock_playwright(mock_httpx):
-    """Mock playwright and browser for unit tests."""
-    with patch(
-        "browser_scraper_pool.pool.context_pool.async_playwright"
-    ) as mock_async_pw:
-        # Create mock objects
-        mock_page = AsyncMock()
-        mock_context = AsyncMock()
-        mock_context.new_page = AsyncMock(return_value=mock_page)
-        mock_context.storage_state = AsyncMock(return_value={"cookies": []})
-        mock_context.close = AsyncMock()
+def mock_httpx():
+    """Patch httpx.Client for CDP endpoint fetching; yields the created clients."""
+    clients: list[_StubClient] = []
+
+    def make_client(**kwargs) -> _StubClient:
+        client = _StubClient(**kwargs)
+        clients.append(client)
+        return client
+
+    with patch("browser_scraper_pool.pool.context_pool.httpx.Client", make_client):
+        yield clients
+
+
+class FakePage:
+    """Stand-in for a Patchright page."""
+
+
+class FakeCDPSession:
+    """Stand-in for a CDP session that reports a fixed target."""
+
+    async def send(self, method: str, params: dict | None = None) -> dict:
+        return {"targetInfo": {"targetId": "fake-target"}}
+
+    async def detach(self) -> None:
+        pass
+
+
+class FakeContext:
+    """Stand-in for a browser context that hands out a shared FakePage."""
+
+    def __init__(self, page: FakePage) -> None:
+        self.page = page
+        self.new_page_calls = 0
+        self.close_calls = 0
+        self.close_error: Exception | None = None
+
+    async def new_page(self) -> FakePage:
+        self.new_page_calls += 1
+        return self.page
+
+    async def new_cdp_session(self, page: FakePage) -> FakeCDPSession:
+        return FakeCDPSession()
+
+    async def storage_state(self) -> dict:
+        return {"cookies": []}
+
+    async def close(self) -> None:
+        self.close_calls += 1
+        if self.close_error is not None:
+            raise self.close_error
+
+
+class FakeBrowser:
+    """Stand-in for a browser that hands out a new FakeContext per call."""
+
+    def __init__(self, page: FakePage) -> None:
+        self.page = page
+        self.contexts: list[FakeContext] = []
+        self.close_calls = 0
+        self.new_context_calls: list[dict] = []
+
+    async def new_context(self, **kwargs) -> FakeContext:
+        self.new_context_calls.append(kwargs)
+        context = FakeContext(self.page)
+        self.contexts.append(context)
+        return context
+
+    async def close(self) -> None:
+        self.close_calls += 1
+
+    def is_connected(self) -> bool:
+        return True
+
 
-        mock_browser = AsyncMock()
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-        mock_browser.close = AsyncMock()
+class FakeChromium:
+    """Stand-in for playwright.chromium that counts launches."""
 
-        mock_pw = AsyncMock()
-        mock_pw.chromium.launch = AsyncMock(return_value=mock_browser)
-        mock_pw.stop = AsyncMock()
+    def __init__(self, browser: FakeBrowser) -> None:
+        self.browser = browser
+        self.launch_calls = 0
+        self.launch_kwargs: dict = {}
 
-        mock_async_pw.return_value.start = AsyncMock(return_value=mock_pw)
+    async def launch(self, **kwargs) -> FakeBrowser:
+        self.launch_calls += 1
+        self.launch_kwargs = kwargs
+        return self.browser
 
+
+class FakePlaywright:
+    """Stand-in for a started Playwright driver."""
+
+    def __init__(self, browser: FakeBrowser) -> None:
+        self.chromium = FakeChromium(browser)
+        self.stop_calls = 0
+
+    async def stop(self) -> None:
+        self.stop_calls += 1
+
+
+class FakePlaywrightManager:
+    """Stand-in for the object returned by async_playwright()."""
+
+    def __init__(self, playwright: FakePlaywright) -> None:
+        self._playwright = playwright
+
+    async def start(self) -> FakePlaywright:
+        return self._playwright
+
+
+@pytest.fixture
+def mock_playwright(mock_httpx):
+    """Patch async_playwright with lightweight fakes for unit tests."""
+    page = FakePage()
+    browser = FakeBrowser(page)
+    playwright = FakePlaywright(browser)
+
+    with patch(
+        "browser_scraper_pool.pool.context_pool.async_playwright",
+        new=lambda: FakePlaywrightManager(playwright),
+    ):
         yield {
-            "async_playwright": mock_async_pw,
-            "playwright": mock_pw,
-            "browser": mock_browser,
-            "context": mock_context,
-            "page": mock_page,
+            "playwright": playwright,
+            "browser": browser,
+            "page": page,
             "httpx_mock": mock_httpx,
         }
 
@@ -85,6 +181,16 @@ def mock_display():
         yield mock
 
 
+@pytest.fixture
+def pool_factory(mock_playwright):
+    """Build headless pools without a virtual display on top of the fakes."""
+
+    def make(**kwargs) -> ContextPool:
+        return ContextPool(headless=True, use_virtual_display=False, **kwargs)
+
+    return make
+
+
 # =============================================================================
 # Parse Proxy URL Tests
 # =============================================================================
@@ -149,35 +255,28 @@ class TestParseProxyUrl:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("pool_isolation")
 class TestSingletonPattern:
     """Tests for singleton behavior."""
 
-    def test_get_instance_returns_same_instance(self):
-        """get_instance() should return the same instance."""
-        pool1 = ContextPool.get_instance()
-        pool2 = ContextPool.get_instance()
-        assert pool1 is pool2
-
-    def test_reset_instance_clears_singleton(self):
-        """reset_instance() should clear the singleton."""
-        pool1 = ContextPool.get_instance()
-        ContextPool.reset_instance()
-        pool2 = ContextPool.get_instance()
-        assert pool1 is not pool2
-
-    def test_direct_instantiation_creates_new_instance(self):
-        """Direct instantiation should create new instances."""
-        pool1 = ContextPool()
-        pool2 = ContextPool()
-        assert pool1 is not pool2
-
-    def test_get_instance_uses_first_params(self):
-        """First call to get_instance() sets the params."""
+    def test_singleton_semantics(self, subtests):
+        """get_instance() shares one pool until reset; direct init does not."""
         pool1 = ContextPool.get_instance(headless=True, cdp_port=9999)
-        pool2 = ContextPool.get_instance(headless=False, cdp_port=8888)
-        assert pool1 is pool2
-        assert pool1.headless is True
-        assert pool1.cdp_port == 9999
+
+        with subtests.test("get_instance returns same instance"):
+            pool2 = ContextPool.get_instance(headless=False, cdp_port=8888)
+            assert pool1 is pool2
+
+        with subtests.test("first get_instance call sets params"):
+            assert pool1.headless is True
+            assert pool1.cdp_port == 9999
+
+        with subtests.test("reset_instance clears singleton"):
+            ContextPool.reset_instance()
+            assert ContextPool.get_instance() is not pool1
+
+        with subtests.test("direct instantiation creates new instances"):
+            assert ContextPool() is not ContextPool()
 
 
 # =============================================================================
@@ -188,56 +287,64 @@ class TestSingletonPattern:
 class TestLifecycle:
     """Tests for pool lifecycle management."""
 
-    async def test_start_launches_browser(self, mock_playwright, mock_display):
+    async def test_start_launches_browser(self, pool_factory, mock_playwright):
         """start() should launch a browser."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
 
-        mock_playwright["playwright"].chromium.launch.assert_called_once()
+        assert mock_playwright["playwright"].chromium.launch_calls == 1
         assert pool.is_started is True
 
-    async def test_start_is_idempotent(self, mock_playwright, mock_display):
+    async def test_start_appends_launch_args(self, pool_factory, mock_playwright):
+        """Extra launch_args are passed to Chrome after the default flags."""
+        pool = pool_factory(
+            cdp_port=9333,
+            launch_args=["--disable-gpu"],
+        )
+        await pool.start()
+
+        args = mock_playwright["playwright"].chromium.launch_kwargs["args"]
+        assert args[0] == "--remote-debugging-port=9333"
+        assert args[-1] == "--disable-gpu"
+
+    async def test_start_is_idempotent(self, pool_factory, mock_playwright):
         """Calling start() twice should not launch another browser."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         await pool.start()
 
-        assert mock_playwright["playwright"].chromium.launch.call_count == 1
+        assert mock_playwright["playwright"].chromium.launch_calls == 1
 
-    async def test_stop_closes_browser(self, mock_playwright, mock_display):
+    async def test_stop_closes_browser(self, pool_factory, mock_playwright):
         """stop() should close the browser."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         await pool.stop()
 
-        mock_playwright["browser"].close.assert_called_once()
+        assert mock_playwright["browser"].close_calls == 1
         assert pool.is_started is False
 
-    async def test_stop_is_idempotent(self, mock_playwright, mock_display):
+    async def test_stop_is_idempotent(self, pool_factory, mock_playwright):
         """Calling stop() twice should not raise."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         await pool.stop()
         await pool.stop()
 
-        assert mock_playwright["browser"].close.call_count == 1
+        assert mock_playwright["browser"].close_calls == 1
 
-    async def test_context_manager_starts_and_stops(
-        self, mock_playwright, mock_display
-    ):
+    async def test_context_manager_starts_and_stops(self, pool_factory):
         """async with should start and stop the pool."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
 
         async with pool:
             assert pool.is_started is True
 
         assert pool.is_started is False
 
-    async def test_context_manager_stops_on_exception(
-        self, mock_playwright, mock_display
-    ):
+    async def test_context_manager_stops_on_exception(self, pool_factory):
         """Pool should stop even if exception is raised."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
 
         with pytest.raises(ValueError, match="test"):
             async with pool:
@@ -245,6 +352,18 @@ class TestLifecycle:
 
         assert pool.is_started is False
 
+    async def test_start_uses_provided_playwright(self, pool_factory, mock_playwright):
+        """A provided playwright driver is used and left running on stop()."""
+        playwright = FakePlaywright(FakeBrowser(FakePage()))
+        pool = pool_factory(playwright=playwright)
+
+        await pool.start()
+        await pool.stop()
+
+        assert playwright.chromium.launch_calls == 1
+        assert playwright.stop_calls == 0
+        assert mock_playwright["playwright"].chromium.launch_calls == 0
+
     async def test_start_with_virtual_display(self, mock_playwright, mock_display):
         """start() should start virtual display when configured."""
         pool = ContextPool(headless=False, use_virtual_display=True)
@@ -279,37 +398,32 @@ class TestLifecycle:
 class TestContextCreation:
     """Tests for context creation."""
 
-    async def test_create_context_returns_instance(self, mock_playwright, mock_display):
+    async def test_create_context_returns_instance(self, pool_factory, mock_playwright):
         """create_context() should return a ContextInstance."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
 
         ctx = await pool.create_context()
 
         assert ctx.id is not None
         assert ctx.context is not None
-        assert ctx.page is not None
+        assert ctx.page is mock_playwright["page"]
         assert ctx.in_use is False
 
-    async def test_create_context_with_proxy(self, mock_playwright, mock_display):
+    async def test_create_context_with_proxy(self, pool_factory, mock_playwright):
         """create_context() should pass proxy to browser context."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
 
         ctx = await pool.create_context(proxy="http://proxy:8080")
 
         assert ctx.proxy == "http://proxy:8080"
-        mock_playwright["browser"].new_context.assert_called_with(
-            proxy={"server": "http://proxy:8080"}
-        )
+        calls = mock_playwright["browser"].new_context_calls
+        assert {"proxy": {"server": "http://proxy:8080"}} in calls
 
-    async def test_create_context_persistent(
-        self, mock_playwright, mock_display, tmp_path
-    ):
+    async def test_create_context_persistent(self, pool_factory, tmp_path):
         """create_context(persistent=True) should set storage path."""
-        pool = ContextPool(
-            headless=True,
-            use_virtual_display=False,
+        pool = pool_factory(
             persistent_contexts_dir=tmp_path,
         )
         await pool.start()
@@ -320,21 +434,23 @@ class TestContextCreation:
         assert ctx.storage_path is not None
         assert ctx.storage_path.parent == tmp_path
 
-    async def test_create_context_not_started_raises(self):
+    async def test_create_context_not_started_raises(self, pool_factory):
         """create_context() should raise if pool not started."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
 
         with pytest.raises(PoolNotStartedError):
             await pool.create_context()
 
-    async def test_create_multiple_contexts(self, mock_playwright, mock_display):
+    async def test_create_multiple_contexts(self, pool_factory):
         """Multiple contexts can be created."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
 
-        ctx1 = await pool.create_context()
-        ctx2 = await pool.create_context()
-        ctx3 = await pool.create_context()
+        ctx1, ctx2, ctx3 = await asyncio.gather(
+            pool.create_context(),
+            pool.create_context(),
+            pool.create_context(),
+        )
 
         assert pool.size == 3
         assert len({ctx1.id, ctx2.id, ctx3.id}) == 3  # All unique IDs
@@ -348,9 +464,9 @@ class TestContextCreation:
 class TestAcquireRelease:
     """Tests for acquire and release operations."""
 
-    async def test_acquire_context_marks_in_use(self, mock_playwright, mock_display):
+    async def test_acquire_context_marks_in_use(self, pool_factory):
         """acquire_context() should mark context as in use."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         ctx = await pool.create_context()
 
@@ -359,27 +475,38 @@ class TestAcquireRelease:
         assert acquired.in_use is True
         assert acquired.id == ctx.id
 
-    async def test_acquire_already_in_use_raises(self, mock_playwright, mock_display):
+    async def test_acquire_already_in_use_raises(self, pool_factory):
         """acquire_context() on in-use context should raise."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
-        ctx = await pool.create_context()
-        await pool.acquire_context(ctx.id)
+        ctx = await pool.create_and_acquire()
 
         with pytest.raises(ContextNotAvailableError):
             await pool.acquire_context(ctx.id)
 
-    async def test_acquire_unknown_id_raises(self, mock_playwright, mock_display):
+    async def test_create_and_acquire_marks_in_use(self, pool_factory):
+        """create_and_acquire() should return a new context already in use."""
+        pool = pool_factory()
+        await pool.start()
+
+        ctx = await pool.create_and_acquire(tags=["premium"])
+
+        assert ctx.in_use is True
+        assert "premium" in ctx.tags
+        assert pool.get_context(ctx.id) is ctx
+        assert pool.select_context() is None
+
+    async def test_acquire_unknown_id_raises(self, pool_factory):
         """acquire_context() with unknown ID should raise."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
 
         with pytest.raises(ContextNotFoundError):
             await pool.acquire_context("unknown-id")
 
-    async def test_release_context_marks_available(self, mock_playwright, mock_display):
+    async def test_release_context_marks_available(self, pool_factory):
         """release_context() should mark context as not in use."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         ctx = await pool.create_context()
         await pool.acquire_context(ctx.id)
@@ -388,16 +515,16 @@ class TestAcquireRelease:
 
         assert ctx.in_use is False
 
-    async def test_release_unknown_id_no_error(self, mock_playwright, mock_display):
+    async def test_release_unknown_id_no_error(self, pool_factory):
         """release_context() with unknown ID should not raise."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
 
         await pool.release_context("unknown-id")  # Should not raise
 
-    async def test_acquire_release_cycle(self, mock_playwright, mock_display):
+    async def test_acquire_release_cycle(self, pool_factory):
         """Context can be acquired and released multiple times."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         ctx = await pool.create_context()
 
@@ -416,9 +543,9 @@ class TestAcquireRelease:
 class TestRemoveContext:
     """Tests for context removal."""
 
-    async def test_remove_context_closes_it(self, mock_playwright, mock_display):
+    async def test_remove_context_closes_it(self, pool_factory, mock_playwright):
         """remove_context() should close the context."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         ctx = await pool.create_context()
 
@@ -426,20 +553,21 @@ class TestRemoveContext:
 
         assert result is True
         assert pool.size == 0
-        mock_playwright["context"].close.assert_called_once()
+        (context,) = mock_playwright["browser"].contexts
+        assert context.close_calls == 1
 
-    async def test_remove_unknown_id_returns_false(self, mock_playwright, mock_display):
+    async def test_remove_unknown_id_returns_false(self, pool_factory):
         """remove_context() with unknown ID should return False."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
 
         result = await pool.remove_context("unknown-id")
 
         assert result is False
 
-    async def test_remove_in_use_context_raises(self, mock_playwright, mock_display):
+    async def test_remove_in_use_context_raises(self, pool_factory):
         """remove_context() on in-use context should raise."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         ctx = await pool.create_context()
         await pool.acquire_context(ctx.id)
@@ -456,9 +584,9 @@ class TestRemoveContext:
 class TestGetContext:
     """Tests for get_context()."""
 
-    async def test_get_context_returns_instance(self, mock_playwright, mock_display):
+    async def test_get_context_returns_instance(self, pool_factory):
         """get_context() should return the context instance."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         ctx = await pool.create_context()
 
@@ -466,11 +594,9 @@ class TestGetContext:
 
         assert result is ctx
 
-    async def test_get_context_unknown_returns_none(
-        self, mock_playwright, mock_display
-    ):
+    async def test_get_context_unknown_returns_none(self, pool_factory):
         """get_context() with unknown ID should return None."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
 
         result = pool.get_context("unknown-id")
@@ -486,18 +612,18 @@ class TestGetContext:
 class TestListContexts:
     """Tests for list_contexts()."""
 
-    async def test_list_contexts_empty(self, mock_playwright, mock_display):
+    async def test_list_contexts_empty(self, pool_factory):
         """list_contexts() should return empty list when no contexts."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
 
         result = pool.list_contexts()
 
         assert result == []
 
-    async def test_list_contexts_returns_all_info(self, mock_playwright, mock_display):
+    async def test_list_contexts_returns_all_info(self, pool_factory):
         """list_contexts() should return all context info."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         ctx = await pool.create_context(proxy="http://proxy:8080")
         await pool.acquire_context(ctx.id)
@@ -510,9 +636,9 @@ class TestListContexts:
         assert result[0]["in_use"] is True
         assert "created_at" in result[0]
 
-    async def test_list_contexts_filter_by_tags(self, mock_playwright, mock_display):
+    async def test_list_contexts_filter_by_tags(self, pool_factory):
         """list_contexts() should filter by tags."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         ctx1 = await pool.create_context(tags=["premium"])
         await pool.create_context(tags=["basic"])
@@ -532,9 +658,9 @@ class TestListContexts:
 class TestTags:
     """Tests for tag management."""
 
-    async def test_create_context_with_tags(self, mock_playwright, mock_display):
+    async def test_create_context_with_tags(self, pool_factory):
         """create_context() should accept and store tags."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
 
         ctx = await pool.create_context(tags=["premium", "fast"])
@@ -542,18 +668,18 @@ class TestTags:
         assert "premium" in ctx.tags
         assert "fast" in ctx.tags
 
-    async def test_create_context_proxy_auto_tag(self, mock_playwright, mock_display):
+    async def test_create_context_proxy_auto_tag(self, pool_factory):
         """create_context() should auto-add proxy as tag."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
 
         ctx = await pool.create_context(proxy="http://proxy:8080")
 
         assert "proxy:http://proxy:8080" in ctx.tags
 
-    async def test_add_tags(self, mock_playwright, mock_display):
+    async def test_add_tags(self, pool_factory):
         """add_tags() should add tags to context."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         ctx = await pool.create_context()
 
@@ -563,18 +689,18 @@ class TestTags:
         assert "new-tag" in ctx.tags
         assert "another" in ctx.tags
 
-    async def test_add_tags_unknown_context(self, mock_playwright, mock_display):
+    async def test_add_tags_unknown_context(self, pool_factory):
         """add_tags() on unknown context should return False."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
 
         result = pool.add_tags("unknown-id", ["tag"])
 
         assert result is False
 
-    async def test_remove_tags(self, mock_playwright, mock_display):
+    async def test_remove_tags(self, pool_factory):
         """remove_tags() should remove tags from context."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         ctx = await pool.create_context(tags=["keep", "remove-me"])
 
@@ -584,9 +710,9 @@ class TestTags:
         assert "keep" in ctx.tags
         assert "remove-me" not in ctx.tags
 
-    async def test_remove_tags_unknown_context(self, mock_playwright, mock_display):
+    async def test_remove_tags_unknown_context(self, pool_factory):
         """remove_tags() on unknown context should return False."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
 
         result = pool.remove_tags("unknown-id", ["tag"])
@@ -602,11 +728,9 @@ class TestTags:
 class TestContextSelection:
     """Tests for smart context selection."""
 
-    async def test_select_context_returns_available(
-        self, mock_playwright, mock_display
-    ):
+    async def test_select_context_returns_available(self, pool_factory):
         """select_context() should return available context."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         ctx = await pool.create_context()
 
@@ -614,9 +738,9 @@ class TestContextSelection:
 
         assert result is ctx
 
-    async def test_select_context_skips_in_use(self, mock_playwright, mock_display):
+    async def test_select_context_skips_in_use(self, pool_factory):
         """select_context() should skip contexts in use."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         ctx1 = await pool.create_context()
         ctx2 = await pool.create_context()
@@ -626,9 +750,9 @@ class TestContextSelection:
 
         assert result is ctx2
 
-    async def test_select_context_filters_by_tags(self, mock_playwright, mock_display):
+    async def test_select_context_filters_by_tags(self, pool_factory):
         """select_context() should filter by tags."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         await pool.create_context(tags=["basic"])
         ctx2 = await pool.create_context(tags=["premium"])
@@ -637,11 +761,9 @@ class TestContextSelection:
 
         assert result is ctx2
 
-    async def test_select_context_returns_none_when_no_match(
-        self, mock_playwright, mock_display
-    ):
+    async def test_select_context_returns_none_when_no_match(self, pool_factory):
         """select_context() should return None when no match."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         await pool.create_context(tags=["basic"])
 
@@ -649,11 +771,9 @@ class TestContextSelection:
 
         assert result is None
 
-    async def test_select_context_prefers_healthier(
-        self, mock_playwright, mock_display
-    ):
+    async def test_select_context_prefers_healthier(self, pool_factory):
         """select_context() should prefer healthier contexts."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         ctx1 = await pool.create_context()
         ctx2 = await pool.create_context()
@@ -667,9 +787,9 @@ class TestContextSelection:
 
         assert result is ctx2
 
-    async def test_get_available_contexts(self, mock_playwright, mock_display):
+    async def test_get_available_contexts(self, pool_factory):
         """get_available_contexts() should return all available contexts."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         ctx1 = await pool.create_context()
         ctx2 = await pool.create_context()
@@ -680,11 +800,9 @@ class TestContextSelection:
         assert len(result) == 1
         assert result[0] is ctx2
 
-    async def test_get_available_contexts_with_tags(
-        self, mock_playwright, mock_display
-    ):
+    async def test_get_available_contexts_with_tags(self, pool_factory):
         """get_available_contexts() should filter by tags."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         await pool.create_context(tags=["basic"])
         ctx2 = await pool.create_context(tags=["premium"])
@@ -703,41 +821,62 @@ class TestContextSelection:
 class TestCDPEndpoint:
     """Tests for CDP endpoint."""
 
-    async def test_get_cdp_endpoint(self, mock_playwright, mock_display):
+    async def test_get_cdp_endpoint(self, pool_factory, mock_playwright):
         """get_cdp_endpoint() should return browser's WebSocket URL from Chrome DevTools API."""
-        pool = ContextPool(headless=True, use_virtual_display=False, cdp_port=9222)
+        pool = pool_factory(cdp_port=9222)
         await pool.start()
 
         result = pool.get_cdp_endpoint()
 
         # Returns the WebSocket URL from mock httpx response
         assert result == "ws://127.0.0.1:9222/devtools/browser/mock-guid"
-        # Verify httpx.Client was created with trust_env=False
-        mock_playwright["httpx_mock"]["httpx"].Client.assert_called_with(
-            trust_env=False
-        )
-        # Verify client.get was called with correct URL
-        mock_playwright["httpx_mock"]["client"].get.assert_called_with(
-            "http://127.0.0.1:9222/json/version"
-        )
+        # One keep-alive client is created at start() and used for the lookup
+        (client,) = mock_playwright["httpx_mock"]
+        assert client.kwargs["trust_env"] is False
+        assert client.requested_urls == ["http://127.0.0.1:9222/json/version"]
+
+    async def test_get_cdp_endpoint_is_cached(self, pool_factory, mock_playwright):
+        """Repeated calls should reuse the endpoint until the pool restarts."""
+        pool = pool_factory()
+        await pool.start()
+
+        first = pool.get_cdp_endpoint()
+        second = pool.get_cdp_endpoint()
+
+        assert first == second
+        (client,) = mock_playwright["httpx_mock"]
+        assert len(client.requested_urls) == 1
 
-    async def test_cdp_port_custom(self, mock_playwright, mock_display):
+        await pool.stop()
+        await pool.start()
+        pool.get_cdp_endpoint()
+
+        assert len(mock_playwright["httpx_mock"][-1].requested_urls) == 1
+        assert len(mock_playwright["httpx_mock"]) == 2
+
+    async def test_stop_closes_cdp_client(self, pool_factory, mock_playwright):
+        """stop() should close the DevTools HTTP client."""
+        pool = pool_factory()
+        await pool.start()
+        await pool.stop()
+
+        (client,) = mock_playwright["httpx_mock"]
+        assert client.close_calls == 1
+
+    async def test_cdp_port_custom(self, pool_factory, mock_playwright):
         """Custom CDP port should be used in httpx request."""
-        pool = ContextPool(headless=True, use_virtual_display=False, cdp_port=9999)
+        pool = pool_factory(cdp_port=9999)
         await pool.start()
 
         assert pool.cdp_port == 9999
         pool.get_cdp_endpoint()
         # Verify client.get was called with custom port
-        mock_playwright["httpx_mock"]["client"].get.assert_called_with(
-            "http://127.0.0.1:9999/json/version"
-        )
+        client = mock_playwright["httpx_mock"][-1]
+        assert client.requested_urls == ["http://127.0.0.1:9999/json/version"]
 
-    async def test_get_cdp_endpoint_raises_when_not_started(
-        self, mock_playwright, mock_display
-    ):
+    async def test_get_cdp_endpoint_raises_when_not_started(self, pool_factory):
         """get_cdp_endpoint() should raise PoolNotStartedError when not started."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
 
         with pytest.raises(PoolNotStartedError):
             pool.get_cdp_endpoint()
@@ -751,41 +890,62 @@ class TestCDPEndpoint:
 class TestProperties:
     """Tests for pool properties."""
 
-    async def test_size_reflects_context_count(self, mock_playwright, mock_display):
-        """size should reflect number of contexts."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
-        await pool.start()
-
-        assert pool.size == 0
-
-        await pool.create_context()
-        assert pool.size == 1
-
-        await pool.create_context()
-        assert pool.size == 2
-
-    async def test_available_count(self, mock_playwright, mock_display):
-        """available_count should reflect available contexts."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+    @pytest.mark.parametrize(
+        ("actions", "expected_size", "expected_available"),
+        [
+            pytest.param([], 0, 0, id="empty"),
+            pytest.param([("create",)], 1, 1, id="one-created"),
+            pytest.param([("create",), ("create",)], 2, 2, id="two-created"),
+            pytest.param(
+                [("create",), ("create",), ("acquire", 0)], 2, 1, id="one-acquired"
+            ),
+            pytest.param(
+                [("create",), ("create",), ("acquire", 0), ("acquire", 1)],
+                2,
+                0,
+                id="all-acquired",
+            ),
+            pytest.param(
+                [
+                    ("create",),
+                    ("create",),
+                    ("acquire", 0),
+                    ("acquire", 1),
+                    ("release", 0),
+                ],
+                2,
+                1,
+                id="one-released",
+            ),
+            pytest.param(
+                [("create",), ("create",), ("remove", 0)], 1, 1, id="one-removed"
+            ),
+        ],
+    )
+    async def test_size_and_available_count(
+        self, pool_factory, actions, expected_size, expected_available
+    ):
+        """size and available_count should track create/acquire/release/remove."""
+        pool = pool_factory()
         await pool.start()
+        created = []
 
-        ctx1 = await pool.create_context()
-        ctx2 = await pool.create_context()
+        for action, *args in actions:
+            if action == "create":
+                created.append(await pool.create_context())
+            elif action == "acquire":
+                await pool.acquire_context(created[args[0]].id)
+            elif action == "release":
+                await pool.release_context(created[args[0]].id)
+            elif action == "remove":
+                await pool.remove_context(created[args[0]].id)
 
-        assert pool.available_count == 2
+        assert pool.size == expected_size
+        assert pool.available_count == expected_available
 
-        await pool.acquire_context(ctx1.id)
-        assert pool.available_count == 1
-
-        await pool.acquire_context(ctx2.id)
-        assert pool.available_count == 0
-
-        await pool.release_context(ctx1.id)
-        assert pool.available_count == 1
-
-    async def test_is_started(self, mock_playwright, mock_display):
+    async def test_is_started(self, pool_factory):
         """is_started should reflect pool state."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
 
         assert pool.is_started is False
 
@@ -804,9 +964,9 @@ class TestProperties:
 class TestCleanup:
     """Tests for cleanup behavior."""
 
-    async def test_stop_closes_all_contexts(self, mock_playwright, mock_display):
+    async def test_stop_closes_all_contexts(self, pool_factory, mock_playwright):
         """stop() should close all contexts."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         await pool.create_context()
         await pool.create_context()
@@ -814,21 +974,26 @@ class TestCleanup:
         await pool.stop()
 
         assert pool.size == 0
-        assert mock_playwright["context"].close.call_count == 2
+        assert [c.close_calls for c in mock_playwright["browser"].contexts] == [1, 1]
 
     async def test_cleanup_handles_context_close_error(
-        self, mock_playwright, mock_display
+        self, pool_factory, mock_playwright
     ):
         """Cleanup should continue even if context close fails."""
-        mock_playwright["context"].close.side_effect = Exception("close error")
-
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = pool_factory()
         await pool.start()
         await pool.create_context()
+        await pool.create_context()
+        failing, healthy = mock_playwright["browser"].contexts
+        failing.close_error = Exception("close error")
 
         await pool.stop()  # Should not raise
 
         assert pool.is_started is False
+        assert pool.size == 0
+        # A failing close must not stop the other contexts from closing
+        assert failing.close_calls == 1
+        assert healthy.close_calls == 1
 
 
 # =============================================================================
@@ -839,9 +1004,9 @@ class TestCleanup:
 class TestRepr:
     """Tests for string representation."""
 
-    def test_repr(self):
+    def test_repr(self, pool_factory):
         """__repr__ should return useful info."""
-        pool = ContextPool(headless=True, use_virtual_display=False, cdp_port=9222)
+        pool = pool_factory(cdp_port=9222)
 
         result = repr(pool)
 
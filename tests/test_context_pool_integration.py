@@ -2,23 +2,81 @@
 
 These tests launch actual browser instances to verify real-world behavior.
 Run with: pytest tests/test_context_pool_integration.py -v
+Run in parallel with: pytest -m integration -n auto
 
 Note: Requires Chromium installed (patchright install chromium)
 """
 
 import asyncio
+import contextlib
+from urllib.parse import urlparse
 
 import pytest
+import pytest_asyncio
 
+from browser_scraper_pool.config import settings
 from browser_scraper_pool.pool.context_pool import ContextPool
 
+pytestmark = [
+    pytest.mark.integration,
+    # Run on the session loop that owns the shared playwright_driver
+    pytest.mark.asyncio(loop_scope="session"),
+]
 
-@pytest.fixture(autouse=True)
-def reset_singleton():
-    """Reset singleton before and after each test."""
-    ContextPool.reset_instance()
-    yield
-    ContextPool.reset_instance()
+
+# Canned example.com page for tests that only need *a* page to load
+_EXAMPLE_HTML = (
+    b"<!doctype html><html><head><title>Example Domain</title></head>"
+    b"<body><h1>Example Domain</h1></body></html>"
+)
+
+# Inline page for tests that only exercise acquire/release, not navigation
+_PLACEHOLDER_HTML = "<html><body>ok</body></html>"
+
+
+async def _serve_example_offline(ctx_instance) -> None:
+    """Answer example.com requests in this context from _EXAMPLE_HTML."""
+    await ctx_instance.context.route(
+        "https://example.com/**",
+        lambda route: route.fulfill(
+            status=200, body=_EXAMPLE_HTML, content_type="text/html"
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def browser_options(playwright_driver, browser_launch_args) -> dict:
+    """Keyword arguments shared by every real-browser ContextPool, minus the port."""
+    return {
+        "headless": True,
+        "use_virtual_display": False,
+        "playwright": playwright_driver,
+        "launch_args": browser_launch_args,
+    }
+
+
+@pytest.fixture
+def pool_options(browser_options, isolated_cdp_port) -> dict:
+    """Options for a test's own ContextPool, on a port apart from shared_pool's."""
+    return {**browser_options, "cdp_port": isolated_cdp_port}
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_pool(browser_options, cdp_port):
+    """One started pool reused by tests that don't exercise pool lifecycle."""
+    pool = ContextPool(**browser_options, cdp_port=cdp_port)
+    await pool.start()
+    yield pool
+    await pool.stop()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def pool(shared_pool):
+    """The shared pool, with any contexts left by the test removed afterwards."""
+    yield shared_pool
+    for info in shared_pool.list_contexts():
+        await shared_pool.release_context(info["id"])
+        await shared_pool.remove_context(info["id"])
 
 
 # =============================================================================
@@ -29,93 +87,82 @@ def reset_singleton():
 class TestRealContextOperations:
     """Tests with real browser contexts."""
 
-    async def test_pool_starts_browser(self):
+    async def test_pool_starts_browser(self, pool_options):
         """Pool should start a real browser."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = ContextPool(**pool_options)
 
         async with pool:
             assert pool.is_started is True
 
-    async def test_create_context(self):
+    async def test_create_context(self, pool):
         """Should create a real browser context."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        ctx = await pool.create_context()
 
-        async with pool:
-            ctx = await pool.create_context()
+        assert ctx.id is not None
+        assert ctx.context is not None
+        assert ctx.page is not None
+        assert pool.size == 1
 
-            assert ctx.id is not None
-            assert ctx.context is not None
-            assert ctx.page is not None
-            assert pool.size == 1
-
-    async def test_navigate_to_url(self):
+    async def test_navigate_to_url(self, pool):
         """Context should navigate to URLs and get content."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        ctx = await pool.create_context()
+        await pool.acquire_context(ctx.id)
 
-        async with pool:
-            ctx = await pool.create_context()
-            await pool.acquire_context(ctx.id)
+        response = await ctx.page.goto("https://example.com")
 
-            response = await ctx.page.goto("https://example.com")
+        assert response is not None
+        assert response.status == 200
 
-            assert response is not None
-            assert response.status == 200
+        title = await ctx.page.title()
+        assert "Example" in title
 
-            title = await ctx.page.title()
-            assert "Example" in title
+        content = await ctx.page.content()
+        assert "<html" in content.lower()
 
-            content = await ctx.page.content()
-            assert "<html" in content.lower()
-
-            await pool.release_context(ctx.id)
+        await pool.release_context(ctx.id)
 
-    async def test_execute_javascript(self):
+    async def test_execute_javascript(self, pool):
         """Context should execute JavaScript and return results."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        ctx = await pool.create_context()
+        await _serve_example_offline(ctx)
+        await pool.acquire_context(ctx.id)
 
-        async with pool:
-            ctx = await pool.create_context()
-            await pool.acquire_context(ctx.id)
+        await ctx.page.goto("https://example.com")
 
-            await ctx.page.goto("https://example.com")
+        # Simple JS
+        result = await ctx.page.evaluate("1 + 2")
+        assert result == 3
 
-            # Simple JS
-            result = await ctx.page.evaluate("1 + 2")
-            assert result == 3
+        # Object return
+        result = await ctx.page.evaluate("({ name: 'test', value: 42 })")
+        assert result == {"name": "test", "value": 42}
 
-            # Object return
-            result = await ctx.page.evaluate("({ name: 'test', value: 42 })")
-            assert result == {"name": "test", "value": 42}
+        # DOM access
+        result = await ctx.page.evaluate("document.title")
+        assert "Example" in result
 
-            # DOM access
-            result = await ctx.page.evaluate("document.title")
-            assert "Example" in result
+        await pool.release_context(ctx.id)
 
-            await pool.release_context(ctx.id)
-
-    async def test_multiple_contexts(self):
+    async def test_multiple_contexts(self, pool):
         """Multiple contexts should work independently."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
-
-        async with pool:
-            ctx1 = await pool.create_context()
-            ctx2 = await pool.create_context()
+        ctx1 = await pool.create_context()
+        ctx2 = await pool.create_context()
 
-            await pool.acquire_context(ctx1.id)
-            await pool.acquire_context(ctx2.id)
+        await pool.acquire_context(ctx1.id)
+        await pool.acquire_context(ctx2.id)
 
-            await ctx1.page.goto("https://example.com")
-            await ctx2.page.goto("https://httpbin.org/html")
+        await ctx1.page.goto("https://example.com")
+        await ctx2.page.goto("https://httpbin.org/html")
 
-            title1 = await ctx1.page.title()
-            title2 = await ctx2.page.title()
+        title1 = await ctx1.page.title()
+        title2 = await ctx2.page.title()
 
-            # Different pages should have different titles
-            assert title1 != title2
-            assert "Example" in title1
+        # Different pages should have different titles
+        assert title1 != title2
+        assert "Example" in title1
 
-            await pool.release_context(ctx1.id)
-            await pool.release_context(ctx2.id)
+        await pool.release_context(ctx1.id)
+        await pool.release_context(ctx2.id)
 
 
 # =============================================================================
@@ -126,58 +173,55 @@ class TestRealContextOperations:
 class TestRealPoolBehavior:
     """Tests for pool behavior with real browser."""
 
-    async def test_acquire_release_cycle(self):
+    async def test_acquire_release_cycle(self, pool):
         """Context should be reusable after release."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        ctx = await pool.create_context()
 
-        async with pool:
-            ctx = await pool.create_context()
-
-            # First acquire
-            await pool.acquire_context(ctx.id)
-            await pool.release_context(ctx.id)
+        # First acquire
+        await pool.acquire_context(ctx.id)
+        await pool.release_context(ctx.id)
 
-            # Second acquire - should work
-            await pool.acquire_context(ctx.id)
-            await ctx.page.goto("https://example.com")
+        # Second acquire - should work
+        await pool.acquire_context(ctx.id)
+        await ctx.page.set_content(_PLACEHOLDER_HTML)
 
-            await pool.release_context(ctx.id)
+        await pool.release_context(ctx.id)
 
-    async def test_concurrent_contexts(self):
+    async def test_concurrent_contexts(self, pool):
         """Multiple contexts should work concurrently."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
 
         async def fetch_title(ctx_instance) -> str:
             await ctx_instance.page.goto("https://example.com", timeout=30000)
             return await ctx_instance.page.title()
 
-        async with pool:
-            ctx1 = await pool.create_context()
-            ctx2 = await pool.create_context()
+        ctx1 = await pool.create_context()
+        await _serve_example_offline(ctx1)
+        ctx2 = await pool.create_context()
+        await _serve_example_offline(ctx2)
 
-            await pool.acquire_context(ctx1.id)
-            await pool.acquire_context(ctx2.id)
+        await pool.acquire_context(ctx1.id)
+        await pool.acquire_context(ctx2.id)
 
-            # Run two fetches concurrently
-            results = await asyncio.gather(
-                fetch_title(ctx1),
-                fetch_title(ctx2),
-            )
+        # Run two fetches concurrently
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(fetch_title(ctx1)),
+                tg.create_task(fetch_title(ctx2)),
+            ]
 
-            assert len(results) == 2
-            assert all("Example" in r for r in results)
+        assert all("Example" in task.result() for task in tasks)
 
-            await pool.release_context(ctx1.id)
-            await pool.release_context(ctx2.id)
+        await pool.release_context(ctx1.id)
+        await pool.release_context(ctx2.id)
 
-    async def test_cdp_port_is_valid(self):
+    async def test_cdp_port_is_valid(self, pool, cdp_port):
         """Browser should have a valid CDP port."""
-        pool = ContextPool(headless=True, use_virtual_display=False, cdp_port=9222)
-
-        async with pool:
-            assert pool.cdp_port == 9222
-            endpoint = pool.get_cdp_endpoint()
-            assert "9222" in endpoint
+        assert pool.cdp_port == cdp_port
+        endpoint = urlparse(pool.get_cdp_endpoint())
+        # The advertised URL uses the public host/port, not the per-worker one
+        assert endpoint.scheme == "ws"
+        assert endpoint.hostname == settings.cdp_public_host
+        assert endpoint.port == settings.cdp_public_port
 
 
 # =============================================================================
@@ -188,76 +232,73 @@ class TestRealPoolBehavior:
 class TestErrorAndRecovery:
     """Tests for error scenarios and recovery."""
 
-    async def test_navigation_timeout_handling(self):
+    async def test_navigation_timeout_handling(self, pool):
         """Pool should handle navigation timeouts gracefully."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
-
-        async with pool:
-            ctx = await pool.create_context()
-            await pool.acquire_context(ctx.id)
+        ctx = await pool.create_context()
+        await _serve_example_offline(ctx)
+        await pool.acquire_context(ctx.id)
 
-            # Try to navigate to a non-responsive URL with short timeout
-            # Patchright raises its own TimeoutError, not Python's built-in
-            with pytest.raises(Exception, match="Timeout"):
-                await ctx.page.goto("http://10.255.255.1", timeout=1000)
+        # Try to navigate to a non-responsive URL with short timeout
+        # Patchright raises its own TimeoutError, not Python's built-in
+        with pytest.raises(Exception, match="Timeout"):
+            await ctx.page.goto("http://10.255.255.1", timeout=1000)
 
-            # Context should still be usable
-            response = await ctx.page.goto("https://example.com", timeout=30000)
-            assert response.status == 200
+        # Context should still be usable
+        response = await ctx.page.goto("https://example.com", timeout=30000)
+        assert response.status == 200
 
-            await pool.release_context(ctx.id)
+        await pool.release_context(ctx.id)
 
-    async def test_invalid_url_handling(self):
+    async def test_invalid_url_handling(self, pool):
         """Pool should handle invalid URLs."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
-
-        async with pool:
-            ctx = await pool.create_context()
-            await pool.acquire_context(ctx.id)
+        ctx = await pool.create_context()
+        await _serve_example_offline(ctx)
+        await pool.acquire_context(ctx.id)
 
-            # Navigate to invalid URL should raise
-            with pytest.raises(Exception):
-                await ctx.page.goto("not-a-valid-url")
+        # Navigate to invalid URL should raise
+        with pytest.raises(Exception):
+            await ctx.page.goto("not-a-valid-url")
 
-            # Context should still be usable
-            response = await ctx.page.goto("https://example.com")
-            assert response.status == 200
+        # Context should still be usable
+        response = await ctx.page.goto("https://example.com")
+        assert response.status == 200
 
-            await pool.release_context(ctx.id)
+        await pool.release_context(ctx.id)
 
-    async def test_context_close_and_recreate(self):
+    async def test_context_close_and_recreate(self, pool):
         """Removing context should allow creating new ones."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
 
-        async with pool:
-            # Create and remove contexts
-            for _ in range(3):
-                ctx = await pool.create_context()
-                await pool.acquire_context(ctx.id)
-                await ctx.page.goto("https://example.com")
-                await pool.release_context(ctx.id)
-                await pool.remove_context(ctx.id)
+        async def make_one() -> None:
+            ctx = await pool.create_context()
+            await pool.acquire_context(ctx.id)
+            await ctx.page.set_content(_PLACEHOLDER_HTML)
+            await pool.release_context(ctx.id)
+            await pool.remove_context(ctx.id)
 
-            assert pool.size == 0
+        # Create and remove contexts concurrently
+        await asyncio.gather(*(make_one() for _ in range(3)))
 
-    async def test_page_crash_recovery(self):
-        """Browser should handle page crashes."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        assert pool.size == 0
 
-        async with pool:
-            ctx = await pool.create_context()
-            await pool.acquire_context(ctx.id)
+    async def test_page_crash_recovery(self, pool):
+        """Browser should handle page crashes."""
+        ctx = await pool.create_context()
+        await _serve_example_offline(ctx)
+        await pool.acquire_context(ctx.id)
 
-            # Crash the page
-            with pytest.raises(Exception):
-                await ctx.page.goto("chrome://crash", timeout=5000)
+        # Crash the renderer directly over CDP. The session dies with the
+        # renderer, so the command itself may error instead of replying.
+        session = await ctx.context.new_cdp_session(ctx.page)
+        async with ctx.page.expect_event("crash", timeout=5000):
+            with contextlib.suppress(Exception):
+                await session.send("Page.crash")
 
-            # Create new page in same context - should work
-            new_page = await ctx.context.new_page()
-            response = await new_page.goto("https://example.com")
-            assert response.status == 200
+        # Create new page in same context - should work
+        new_page = await ctx.context.new_page()
+        response = await new_page.goto("https://example.com")
+        assert response.status == 200
 
-            await pool.release_context(ctx.id)
+        await pool.release_context(ctx.id)
 
 
 # =============================================================================
@@ -268,13 +309,9 @@ class TestErrorAndRecovery:
 class TestPersistentContexts:
     """Tests for persistent context storage."""
 
-    async def test_persistent_context_creates_storage_dir(self, tmp_path):
+    async def test_persistent_context_creates_storage_dir(self, tmp_path, pool_options):
         """Persistent context should create storage directory."""
-        pool = ContextPool(
-            headless=True,
-            use_virtual_display=False,
-            persistent_contexts_dir=tmp_path,
-        )
+        pool = ContextPool(**pool_options, persistent_contexts_dir=tmp_path)
 
         async with pool:
             ctx = await pool.create_context(persistent=True)
@@ -283,20 +320,18 @@ class TestPersistentContexts:
             assert ctx.storage_path is not None
             assert ctx.storage_path.exists()
 
-    async def test_persistent_context_saves_state_on_release(self, tmp_path):
+    async def test_persistent_context_saves_state_on_release(
+        self, tmp_path, pool_options
+    ):
         """Persistent context should save state on release."""
-        pool = ContextPool(
-            headless=True,
-            use_virtual_display=False,
-            persistent_contexts_dir=tmp_path,
-        )
+        pool = ContextPool(**pool_options, persistent_contexts_dir=tmp_path)
 
         async with pool:
             ctx = await pool.create_context(persistent=True)
             await pool.acquire_context(ctx.id)
 
-            # Navigate to set some cookies
-            await ctx.page.goto("https://example.com")
+            # Give the page some content; the state file is written either way
+            await ctx.page.set_content(_PLACEHOLDER_HTML)
 
             await pool.release_context(ctx.id)
 
@@ -313,9 +348,9 @@ class TestPersistentContexts:
 class TestResourceCleanup:
     """Tests for proper resource cleanup."""
 
-    async def test_contexts_cleaned_on_pool_stop(self):
+    async def test_contexts_cleaned_on_pool_stop(self, pool_options):
         """All contexts should be closed when pool stops."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = ContextPool(**pool_options)
 
         async with pool:
             await pool.create_context()
@@ -325,15 +360,17 @@ class TestResourceCleanup:
         # After pool stops, contexts should be cleaned
         assert pool.size == 0
 
-    async def test_multiple_start_stop_cycles(self):
+    async def test_multiple_start_stop_cycles(self, pool_options):
         """Pool should handle multiple start/stop cycles."""
-        pool = ContextPool(headless=True, use_virtual_display=False)
+        pool = ContextPool(**pool_options)
 
-        for _ in range(3):
+        # Two cycles cover stop -> start on the same instance; each extra cycle
+        # only repeats that transition at the cost of another Chrome cold start
+        for _ in range(2):
             async with pool:
                 ctx = await pool.create_context()
                 await pool.acquire_context(ctx.id)
-                await ctx.page.goto("https://example.com")
+                await ctx.page.set_content(_PLACEHOLDER_HTML)
                 await pool.release_context(ctx.id)
 
             assert pool.is_started is False
@@ -1,7 +1,7 @@
 """Tests for eviction strategy."""
 
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -12,19 +12,30 @@ from browser_scraper_pool.pool.eviction import (
 )
 
 
+@dataclass(slots=True)
+class _CtxStub:
+    """Stand-in for ContextInstance with only the fields eviction reads."""
+
+    id: str
+    in_use: bool = False
+    tags: set[str] = field(default_factory=set)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    last_used_at: datetime | None = None
+    total_requests: int = 0
+    error_count: int = 0
+    consecutive_errors: int = 0
+
+
+@pytest.fixture
+def now() -> datetime:
+    """Single reference time so relative timestamps never straddle a clock tick."""
+    return datetime.now(UTC)
+
+
 @pytest.fixture
-def mock_context():
-    """Create a mock context with eviction-relevant fields."""
-    ctx = MagicMock()
-    ctx.id = "ctx-123"
-    ctx.in_use = False
-    ctx.tags = set()
-    ctx.created_at = datetime.now(UTC)
-    ctx.last_used_at = None
-    ctx.total_requests = 0
-    ctx.error_count = 0
-    ctx.consecutive_errors = 0
-    return ctx
+def mock_context(now):
+    """Create a stub context with eviction-relevant fields."""
+    return _CtxStub(id="ctx-123", created_at=now)
 
 
 class TestCalculateEvictionScore:
@@ -46,14 +57,14 @@ class TestCalculateEvictionScore:
 
         assert score == float("-inf")
 
-    def test_idle_context_gets_higher_score(self, mock_context):
+    def test_idle_context_gets_higher_score(self, mock_context, now):
         """Idle contexts should get higher eviction scores."""
         # Fresh context
-        mock_context.created_at = datetime.now(UTC)
+        mock_context.created_at = now
         score_fresh = calculate_eviction_score(mock_context)
 
         # Idle context (created 1 hour ago)
-        mock_context.created_at = datetime.now(UTC) - timedelta(hours=1)
+        mock_context.created_at = now - timedelta(hours=1)
         score_idle = calculate_eviction_score(mock_context)
 
         assert score_idle > score_fresh
@@ -69,39 +80,36 @@ class TestCalculateEvictionScore:
 
         assert score_with_errors > score_no_errors
 
-    def test_age_increases_score(self, mock_context):
+    def test_age_increases_score(self, mock_context, now):
         """Older contexts should have higher eviction scores."""
-        mock_context.created_at = datetime.now(UTC)
+        mock_context.created_at = now
         score_new = calculate_eviction_score(mock_context)
 
-        mock_context.created_at = datetime.now(UTC) - timedelta(days=1)
+        mock_context.created_at = now - timedelta(days=1)
         score_old = calculate_eviction_score(mock_context)
 
         assert score_old > score_new
 
+    def test_explicit_now_is_used(self, mock_context, now):
+        """Scores should be computed against the given reference time."""
+        mock_context.created_at = now - timedelta(hours=1)
+
+        score_at_now = calculate_eviction_score(mock_context, now=now)
+        score_later = calculate_eviction_score(
+            mock_context, now=now + timedelta(hours=1)
+        )
+
+        assert score_at_now == calculate_eviction_score(mock_context, now=now)
+        assert score_later > score_at_now
+
 
 class TestFindEvictionCandidate:
     """Tests for find_eviction_candidate()."""
 
-    def test_returns_highest_scoring_context(self):
+    def test_returns_highest_scoring_context(self, now):
         """Should return context with highest eviction score."""
-        old_ctx = MagicMock()
-        old_ctx.id = "old"
-        old_ctx.in_use = False
-        old_ctx.tags = set()
-        old_ctx.created_at = datetime.now(UTC) - timedelta(hours=2)
-        old_ctx.last_used_at = None
-        old_ctx.total_requests = 0
-        old_ctx.error_count = 0
-
-        new_ctx = MagicMock()
-        new_ctx.id = "new"
-        new_ctx.in_use = False
-        new_ctx.tags = set()
-        new_ctx.created_at = datetime.now(UTC)
-        new_ctx.last_used_at = None
-        new_ctx.total_requests = 0
-        new_ctx.error_count = 0
+        old_ctx = _CtxStub(id="old", created_at=now - timedelta(hours=2))
+        new_ctx = _CtxStub(id="new", created_at=now)
 
         contexts = {"old": old_ctx, "new": new_ctx}
 
@@ -109,25 +117,14 @@ class TestFindEvictionCandidate:
 
         assert result is old_ctx
 
-    def test_skips_protected_contexts(self):
+    def test_skips_protected_contexts(self, now):
         """Should skip protected contexts."""
-        protected_ctx = MagicMock()
-        protected_ctx.id = "protected"
-        protected_ctx.in_use = False
-        protected_ctx.tags = {"protected"}
-        protected_ctx.created_at = datetime.now(UTC) - timedelta(hours=10)
-        protected_ctx.last_used_at = None
-        protected_ctx.total_requests = 0
-        protected_ctx.error_count = 0
-
-        normal_ctx = MagicMock()
-        normal_ctx.id = "normal"
-        normal_ctx.in_use = False
-        normal_ctx.tags = set()
-        normal_ctx.created_at = datetime.now(UTC)
-        normal_ctx.last_used_at = None
-        normal_ctx.total_requests = 0
-        normal_ctx.error_count = 0
+        protected_ctx = _CtxStub(
+            id="protected",
+            tags={"protected"},
+            created_at=now - timedelta(hours=10),
+        )
+        normal_ctx = _CtxStub(id="normal", created_at=now)
 
         contexts = {"protected": protected_ctx, "normal": normal_ctx}
 
@@ -135,23 +132,12 @@ class TestFindEvictionCandidate:
 
         assert result is normal_ctx
 
-    def test_skips_in_use_contexts(self):
+    def test_skips_in_use_contexts(self, now):
         """Should skip in-use contexts."""
-        in_use_ctx = MagicMock()
-        in_use_ctx.id = "in_use"
-        in_use_ctx.in_use = True
-        in_use_ctx.tags = set()
-        in_use_ctx.created_at = datetime.now(UTC) - timedelta(hours=10)
-        in_use_ctx.last_used_at = None
-
-        available_ctx = MagicMock()
-        available_ctx.id = "available"
-        available_ctx.in_use = False
-        available_ctx.tags = set()
-        available_ctx.created_at = datetime.now(UTC)
-        available_ctx.last_used_at = None
-        available_ctx.total_requests = 0
-        available_ctx.error_count = 0
+        in_use_ctx = _CtxStub(
+            id="in_use", in_use=True, created_at=now - timedelta(hours=10)
+        )
+        available_ctx = _CtxStub(id="available", created_at=now)
 
         contexts = {"in_use": in_use_ctx, "available": available_ctx}
 
@@ -159,14 +145,9 @@ class TestFindEvictionCandidate:
 
         assert result is available_ctx
 
-    def test_returns_none_when_all_protected(self):
+    def test_returns_none_when_all_protected(self, now):
         """Should return None when all contexts are protected."""
-        protected_ctx = MagicMock()
-        protected_ctx.id = "protected"
-        protected_ctx.in_use = False
-        protected_ctx.tags = {"protected"}
-        protected_ctx.created_at = datetime.now(UTC)
-        protected_ctx.last_used_at = None
+        protected_ctx = _CtxStub(id="protected", tags={"protected"}, created_at=now)
 
         contexts = {"protected": protected_ctx}
 
@@ -174,25 +155,14 @@ class TestFindEvictionCandidate:
 
         assert result is None
 
-    def test_exclude_tags(self):
+    def test_exclude_tags(self, now):
         """Should skip contexts with excluded tags."""
-        premium_ctx = MagicMock()
-        premium_ctx.id = "premium"
-        premium_ctx.in_use = False
-        premium_ctx.tags = {"premium"}
-        premium_ctx.created_at = datetime.now(UTC) - timedelta(hours=10)
-        premium_ctx.last_used_at = None
-        premium_ctx.total_requests = 0
-        premium_ctx.error_count = 0
-
-        basic_ctx = MagicMock()
-        basic_ctx.id = "basic"
-        basic_ctx.in_use = False
-        basic_ctx.tags = {"basic"}
-        basic_ctx.created_at = datetime.now(UTC)
-        basic_ctx.last_used_at = None
-        basic_ctx.total_requests = 0
-        basic_ctx.error_count = 0
+        premium_ctx = _CtxStub(
+            id="premium",
+            tags={"premium"},
+            created_at=now - timedelta(hours=10),
+        )
+        basic_ctx = _CtxStub(id="basic", tags={"basic"}, created_at=now)
 
         contexts = {"premium": premium_ctx, "basic": basic_ctx}
 
@@ -227,3 +197,10 @@ class TestShouldRecreate:
         result = should_recreate(mock_context)
 
         assert result is True
+
+    def test_explicit_threshold_overrides_setting(self, mock_context):
+        """An explicit threshold should be used instead of the configured one."""
+        mock_context.consecutive_errors = 2
+
+        assert should_recreate(mock_context, threshold=2) is True
+        assert should_recreate(mock_context, threshold=3) is False
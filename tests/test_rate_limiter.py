@@ -1,7 +1,6 @@
 """Tests for domain rate limiter."""
 
-import asyncio
-from datetime import UTC, datetime, timedelta
+import time
 from unittest.mock import MagicMock
 
 import pytest
@@ -35,7 +34,7 @@ class TestCanRequest:
     def test_request_blocked_within_delay(self, mock_context):
         """Request within delay window should be blocked."""
         limiter = DomainRateLimiter(default_delay_ms=1000)
-        mock_context.domain_last_request["example.com"] = datetime.now(UTC)
+        mock_context.domain_last_request["example.com"] = time.monotonic()
 
         result = limiter.can_request(mock_context, "example.com")
 
@@ -44,9 +43,7 @@ class TestCanRequest:
     def test_request_allowed_after_delay(self, mock_context):
         """Request after delay window should be allowed."""
         limiter = DomainRateLimiter(default_delay_ms=1000)
-        mock_context.domain_last_request["example.com"] = datetime.now(UTC) - timedelta(
-            seconds=2
-        )
+        mock_context.domain_last_request["example.com"] = time.monotonic() - 2
 
         result = limiter.can_request(mock_context, "example.com")
 
@@ -55,7 +52,7 @@ class TestCanRequest:
     def test_different_domains_independent(self, mock_context):
         """Different domains should have independent rate limits."""
         limiter = DomainRateLimiter(default_delay_ms=1000)
-        mock_context.domain_last_request["example.com"] = datetime.now(UTC)
+        mock_context.domain_last_request["example.com"] = time.monotonic()
 
         result = limiter.can_request(mock_context, "other.com")
 
@@ -64,9 +61,7 @@ class TestCanRequest:
     def test_custom_delay_override(self, mock_context):
         """Custom delay should override default."""
         limiter = DomainRateLimiter(default_delay_ms=1000)
-        mock_context.domain_last_request["example.com"] = datetime.now(UTC) - timedelta(
-            milliseconds=500
-        )
+        mock_context.domain_last_request["example.com"] = time.monotonic() - 0.5
 
         # Default 1000ms - should be blocked
         assert limiter.can_request(mock_context, "example.com") is False
@@ -85,7 +80,7 @@ class TestRecordRequest:
         limiter.record_request(mock_context, "example.com")
 
         assert "example.com" in mock_context.domain_last_request
-        assert isinstance(mock_context.domain_last_request["example.com"], datetime)
+        assert isinstance(mock_context.domain_last_request["example.com"], float)
 
     def test_updates_last_used_at(self, mock_context):
         """Should update context's last_used_at."""
@@ -119,9 +114,7 @@ class TestTimeUntilAvailable:
     def test_returns_zero_when_delay_passed(self, mock_context):
         """Should return 0 when delay has passed."""
         limiter = DomainRateLimiter(default_delay_ms=1000)
-        mock_context.domain_last_request["example.com"] = datetime.now(UTC) - timedelta(
-            seconds=2
-        )
+        mock_context.domain_last_request["example.com"] = time.monotonic() - 2
 
         result = limiter.time_until_available(mock_context, "example.com")
 
@@ -130,9 +123,7 @@ class TestTimeUntilAvailable:
     def test_returns_remaining_time(self, mock_context):
         """Should return remaining time in seconds."""
         limiter = DomainRateLimiter(default_delay_ms=1000)
-        mock_context.domain_last_request["example.com"] = datetime.now(UTC) - timedelta(
-            milliseconds=400
-        )
+        mock_context.domain_last_request["example.com"] = time.monotonic() - 0.4
 
         result = limiter.time_until_available(mock_context, "example.com")
 
@@ -199,13 +190,31 @@ class TestExtractDomain:
         result = DomainRateLimiter.extract_domain("https://www.example.com/path")
         assert result == "www.example.com"
 
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://example.com", "example.com"),
+            ("https://example.com?next=http://other.com/", "example.com"),
+            ("https://example.com#section/1", "example.com"),
+            ("//example.com/path", "example.com"),
+            ("example.com/path", "example.com"),
+            ("example.com/?next=http://other.com", "example.com"),
+            # urlparse read "localhost" as a scheme here and returned "8080"
+            ("localhost:8080/path", "localhost:8080"),
+        ],
+    )
+    def test_extract_edge_cases(self, url, expected):
+        """Should stop at path, query or fragment and handle missing schemes."""
+        assert DomainRateLimiter.extract_domain(url) == expected
+
 
 class TestRateLimitIntegration:
     """Integration tests for rate limiting workflow."""
 
-    async def test_full_workflow(self, mock_context):
+    def test_full_workflow(self, mock_context):
         """Test complete rate limiting workflow."""
-        limiter = DomainRateLimiter(default_delay_ms=100)  # 100ms for fast test
+        now = [0.0]
+        limiter = DomainRateLimiter(default_delay_ms=100, time_func=lambda: now[0])
         domain = "example.com"
 
         # First request should be allowed
@@ -217,8 +226,8 @@ class TestRateLimitIntegration:
         # Immediate second request should be blocked
         assert limiter.can_request(mock_context, domain) is False
 
-        # Wait for rate limit to expire
-        await asyncio.sleep(0.15)  # 150ms > 100ms delay
+        # Step the clock past the rate limit
+        now[0] += 0.15  # 150ms > 100ms delay
 
         # Now should be allowed
         assert limiter.can_request(mock_context, domain) is True
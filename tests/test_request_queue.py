@@ -1,7 +1,6 @@
 """Tests for request queue."""
 
 import asyncio
-from datetime import UTC, datetime, timedelta
 
 import pytest
 
@@ -43,7 +42,7 @@ class TestQueuedRequest:
         """Old request should be expired."""
         req = QueuedRequest.create()
         # Make request old
-        req.created_at = datetime.now(UTC) - timedelta(minutes=10)
+        req.created_at_mono -= 600
 
         assert req.is_expired() is True
 
@@ -101,6 +100,26 @@ class TestRequestQueue:
         assert len(pending) == 1
         assert pending[0].id == req2.id
 
+    async def test_get_pending_excludes_settled(self):
+        """Resolved, rejected and externally cancelled requests aren't pending."""
+        queue = RequestQueue()
+        req1 = await queue.enqueue(tags={"premium"})
+        req2 = await queue.enqueue(tags={"premium"})
+        req3 = await queue.enqueue(tags={"premium"})
+        req4 = await queue.enqueue(tags={"premium"})
+
+        await queue.resolve(req1.id, "context")
+        await queue.reject(req2.id, ValueError("test error"))
+        req3.future.cancel()
+        await asyncio.sleep(0)  # let the done callback run
+
+        assert [r.id for r in queue.get_pending()] == [req4.id]
+        assert queue.get_pending_count() == 1
+        assert queue.get_pending_count(tags={"premium"}) == 1
+        assert len(queue) == 4
+        with pytest.raises(ValueError, match="test error"):
+            req2.future.result()
+
     async def test_get_pending_count(self):
         """Should count pending requests."""
         queue = RequestQueue()
@@ -128,7 +147,7 @@ class TestRequestQueue:
         req = await queue.enqueue()
 
         # Make request expired
-        req.created_at = datetime.now(UTC) - timedelta(minutes=10)
+        req.created_at_mono -= 600
 
         expired_count = await queue.cleanup_expired()
 
@@ -180,6 +199,15 @@ class TestRequestQueue:
 
         assert match is req2
 
+    async def test_find_match_accepts_any_iterable(self):
+        """Should accept available tags as a list, duplicates included."""
+        queue = RequestQueue()
+        req = await queue.enqueue(tags={"premium", "fast"})
+
+        match = queue.find_match(available_tags=["premium", "premium", "fast"])
+
+        assert match is req
+
     async def test_find_match_no_match(self):
         """Should return None when no match."""
         queue = RequestQueue()
@@ -197,6 +225,39 @@ class TestRequestQueue:
 
         assert match is None
 
+    async def test_find_match_prefers_oldest_across_tag_sets(self):
+        """Should return the oldest matching request, whatever its tags."""
+        queue = RequestQueue()
+        first = await queue.enqueue(tags={"premium"})
+        await queue.enqueue()
+        await queue.enqueue(tags={"premium", "fast"})
+
+        match = queue.find_match(available_tags={"premium", "fast"})
+
+        assert match is first
+
+    async def test_find_match_skips_other_domains_and_resolved(self):
+        """Should skip resolved requests and requests for another domain."""
+        queue = RequestQueue()
+        resolved = await queue.enqueue(domain="a.com")
+        await queue.enqueue(domain="b.com")
+        wanted = await queue.enqueue(domain="a.com")
+        resolved.future.set_result("done")
+
+        match = queue.find_match(available_tags=set(), domain="a.com")
+
+        assert match is wanted
+
+    async def test_dequeue_updates_tag_counts(self):
+        """Removed requests should no longer be counted or matched."""
+        queue = RequestQueue()
+        req = await queue.enqueue(tags={"premium"})
+
+        await queue.dequeue(req.id)
+
+        assert queue.get_pending_count(tags={"premium"}) == 0
+        assert queue.find_match(available_tags={"premium"}) is None
+
     async def test_concurrent_operations(self):
         """Should handle concurrent enqueue/dequeue."""
         queue = RequestQueue()
@@ -243,7 +304,7 @@ class TestQueueIntegration:
         req = await queue.enqueue()
 
         # Make request expire immediately
-        req.created_at = datetime.now(UTC) - timedelta(minutes=10)
+        req.created_at_mono -= 600
 
         # Cleanup should expire it
         await queue.cleanup_expired()
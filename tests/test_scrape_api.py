@@ -1,32 +1,48 @@
 """Tests for unified /scrape endpoint."""
 
 from datetime import UTC, datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from httpx import ASGITransport, AsyncClient
 
-from browser_scraper_pool.main import app
+from browser_scraper_pool.api import get_pool
+from browser_scraper_pool.api.scrape import scrape
+from browser_scraper_pool.models.schemas import ScrapeRequest
 from browser_scraper_pool.pool.context_pool import ContextPool
 
+# Share the session-scoped client, which lives on the session loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.fixture(autouse=True)
-def reset_singleton():
-    """Reset singleton before and after each test."""
-    ContextPool.reset_instance()
-    yield
-    ContextPool.reset_instance()
+# No /scrape test reads the context's creation time
+_FIXED_NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture(scope="module")
+def page_template() -> dict:
+    """Page attributes shared by every mock context in the module.
+
+    Tests that need different page behaviour replace an attribute on their own
+    ``ctx.page`` rather than configuring these mocks.
+    """
+    return {
+        "url": "https://example.com",
+        "goto": AsyncMock(return_value=MagicMock(status=200, ok=True)),
+        "content": AsyncMock(return_value="<html><body>Hello</body></html>"),
+        "evaluate": AsyncMock(return_value="Example Domain"),
+        "screenshot": AsyncMock(return_value=b"fake-png-data"),
+    }
 
 
 @pytest.fixture
-def mock_context():
+def mock_context(page_template):
     """Create a mock context."""
     ctx = MagicMock()
     ctx.id = "ctx-123"
     ctx.proxy = None
     ctx.persistent = False
     ctx.in_use = True
-    ctx.created_at = datetime.now(UTC)
+    ctx.created_at = _FIXED_NOW
     ctx.tags = set()
     ctx.last_used_at = None
     ctx.total_requests = 0
@@ -34,25 +50,29 @@ def mock_context():
     ctx.consecutive_errors = 0
     ctx.domain_last_request = {}
 
-    # Mock page
-    mock_page = AsyncMock()
-    mock_page.url = "https://example.com"
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_response.ok = True
-    mock_page.goto = AsyncMock(return_value=mock_response)
-    mock_page.content = AsyncMock(return_value="<html><body>Hello</body></html>")
-    mock_page.evaluate = AsyncMock(return_value="Example Domain")
-    mock_page.screenshot = AsyncMock(return_value=b"fake-png-data")
-    ctx.page = mock_page
+    ctx.page = SimpleNamespace(**page_template)
 
     return ctx
 
 
-@pytest.fixture
-def mock_pool(mock_context):
-    """Create a mock pool."""
-    pool = MagicMock(spec=ContextPool)
+def _make_new_context() -> MagicMock:
+    """Create a mock for a context the pool creates when none matches."""
+    ctx = MagicMock()
+    ctx.id = "ctx-new"
+    ctx.in_use = True
+    ctx.consecutive_errors = 0
+    ctx.domain_last_request = {}
+    page = AsyncMock()
+    page.url = "https://example.com"
+    page.goto = AsyncMock(return_value=MagicMock(status=200))
+    page.content = AsyncMock(return_value="<html></html>")
+    ctx.page = page
+    return ctx
+
+
+def _configure_pool(pool: MagicMock, ctx: MagicMock) -> None:
+    """Reset a mock pool and apply the defaults every test starts from."""
+    pool.reset_mock(return_value=True, side_effect=True)
     pool.size = 1
     pool.available_count = 1
     pool.cdp_port = 9222
@@ -60,21 +80,35 @@ def mock_pool(mock_context):
     pool.get_cdp_endpoint.return_value = (
         "ws://127.0.0.1:9222/devtools/browser/mock-guid"
     )
-    pool.select_context.return_value = mock_context
-    pool.acquire_context = AsyncMock(return_value=mock_context)
+    pool.select_context.return_value = ctx
+    pool.acquire_context = AsyncMock(return_value=ctx)
     pool.release_context = AsyncMock()
     pool.evict_and_replace = AsyncMock(return_value=None)
     pool.recreate_context = AsyncMock(return_value=None)
-    return pool
+
+
+@pytest.fixture(scope="module")
+def mock_pool():
+    """Create a mock pool, once per module.
+
+    ``spec=ContextPool`` introspects the class on construction, so the mock is
+    built once and reset to its defaults before each test instead.
+    """
+    return MagicMock(spec=ContextPool)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_pool(mock_pool, mock_context):
+    """Give each test a freshly configured pool bound to its mock context."""
+    _configure_pool(mock_pool, mock_context)
 
 
 @pytest.fixture
-async def client(mock_pool):
-    """Create test client with mocked pool."""
-    app.state.context_pool = mock_pool
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+def client(mock_pool, asgi_app, session_client):
+    """Session test client, with the mocked pool installed for this test."""
+    asgi_app.dependency_overrides[get_pool] = lambda: mock_pool
+    yield session_client
+    asgi_app.dependency_overrides.pop(get_pool, None)
 
 
 class TestScrapeEndpoint:
@@ -95,63 +129,61 @@ class TestScrapeEndpoint:
         assert data["content"] == "<html><body>Hello</body></html>"
         assert data["context_id"] == "ctx-123"
 
-    async def test_scrape_with_script(self, client, mock_pool, mock_context):
-        """Should execute script and return result."""
-        response = await client.post(
-            "/scrape",
-            json={"url": "https://example.com", "script": "document.title"},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert data["script_result"] == "Example Domain"
-
-    async def test_scrape_with_screenshot(self, client, mock_pool, mock_context):
-        """Should take screenshot and return base64."""
+    @pytest.mark.parametrize(
+        ("options", "field", "expected"),
+        [
+            pytest.param(
+                {"script": "document.title"},
+                "script_result",
+                "Example Domain",
+                id="script",
+            ),
+            # base64 of the mocked b"fake-png-data"
+            pytest.param(
+                {"screenshot": True},
+                "screenshot",
+                "ZmFrZS1wbmctZGF0YQ==",
+                id="screenshot",
+            ),
+            pytest.param({"get_content": False}, "content", None, id="no-content"),
+        ],
+    )
+    async def test_scrape_options(
+        self, client, mock_pool, mock_context, options, field, expected
+    ):
+        """Optional script, screenshot and content flags shape the response."""
         response = await client.post(
             "/scrape",
-            json={"url": "https://example.com", "screenshot": True},
+            json={"url": "https://example.com", **options},
         )
 
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
-        assert data["screenshot"] is not None
-        assert len(data["screenshot"]) > 0
+        assert data[field] == expected
 
-    async def test_scrape_without_content(self, client, mock_pool, mock_context):
-        """Should skip content when get_content=False."""
-        response = await client.post(
-            "/scrape",
-            json={"url": "https://example.com", "get_content": False},
-        )
+    # The next three only inspect pool calls, so they call the route handler
+    # directly instead of going through HTTP routing and JSON encoding
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert data["content"] is None
-
-    async def test_scrape_with_tags(self, client, mock_pool, mock_context):
+    async def test_scrape_with_tags(self, mock_pool, mock_context):
         """Should pass tags to context selection."""
-        response = await client.post(
-            "/scrape",
-            json={"url": "https://example.com", "tags": ["premium"]},
+        result = await scrape(
+            mock_pool, ScrapeRequest(url="https://example.com", tags=["premium"])
         )
 
-        assert response.status_code == 200
+        assert result.success is True
         mock_pool.select_context.assert_called_once()
         call_args = mock_pool.select_context.call_args
         assert "premium" in call_args.kwargs["tags"]
 
-    async def test_scrape_with_proxy(self, client, mock_pool, mock_context):
+    async def test_scrape_with_proxy(self, mock_pool, mock_context):
         """Proxy should NOT be used for selection, only for creation."""
-        response = await client.post(
-            "/scrape",
-            json={"url": "https://example.com", "proxy": "http://proxy:8080"},
+        result = await scrape(
+            mock_pool,
+            ScrapeRequest(url="https://example.com", proxy="http://proxy:8080"),
         )
 
-        assert response.status_code == 200
+        assert result.success is True
         mock_pool.select_context.assert_called_once()
         call_args = mock_pool.select_context.call_args
         # Proxy is NOT added to selection tags - only user tags are used
@@ -160,36 +192,24 @@ class TestScrapeEndpoint:
             or "proxy:http://proxy:8080" not in call_args.kwargs["tags"]
         )
 
-    async def test_scrape_creates_context_with_proxy(self, client, mock_pool):
+    async def test_scrape_creates_context_with_proxy(self, mock_pool):
         """Should create context with proxy when no match found."""
         mock_pool.select_context.return_value = None
 
-        new_ctx = MagicMock()
-        new_ctx.id = "ctx-new"
-        new_ctx.in_use = True
-        new_ctx.consecutive_errors = 0
-        new_ctx.domain_last_request = {}
-        mock_page = AsyncMock()
-        mock_page.url = "https://example.com"
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_page.goto = AsyncMock(return_value=mock_response)
-        mock_page.content = AsyncMock(return_value="<html></html>")
-        new_ctx.page = mock_page
-
+        new_ctx = _make_new_context()
         mock_pool.evict_and_replace = AsyncMock(return_value=new_ctx)
         mock_pool.acquire_context = AsyncMock(return_value=new_ctx)
 
-        response = await client.post(
-            "/scrape",
-            json={
-                "url": "https://example.com",
-                "proxy": "http://proxy:8080",
-                "tags": ["spider1"],
-            },
+        result = await scrape(
+            mock_pool,
+            ScrapeRequest(
+                url="https://example.com",
+                proxy="http://proxy:8080",
+                tags=["spider1"],
+            ),
         )
 
-        assert response.status_code == 200
+        assert result.success is True
         # evict_and_replace should be called with the proxy
         mock_pool.evict_and_replace.assert_called_once()
         call_args = mock_pool.evict_and_replace.call_args
@@ -197,7 +217,7 @@ class TestScrapeEndpoint:
         assert "spider1" in call_args.kwargs["tags"]
 
     async def test_scrape_navigation_error(self, client, mock_pool, mock_context):
-        """Should return error response on navigation failure."""
+        """Should return an error response and release the context on failure."""
         mock_context.page.goto = AsyncMock(side_effect=Exception("Connection refused"))
 
         response = await client.post(
@@ -209,25 +229,14 @@ class TestScrapeEndpoint:
         data = response.json()
         assert data["success"] is False
         assert "Connection refused" in data["error"]
+        mock_pool.release_context.assert_called_once_with("ctx-123")
 
     async def test_scrape_no_context_available(self, client, mock_pool):
         """Should evict and create when no context available."""
         mock_pool.select_context.return_value = None
         mock_pool.size = 10  # At capacity
 
-        new_ctx = MagicMock()
-        new_ctx.id = "ctx-new"
-        new_ctx.in_use = True
-        new_ctx.consecutive_errors = 0
-        new_ctx.domain_last_request = {}
-        mock_page = AsyncMock()
-        mock_page.url = "https://example.com"
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_page.goto = AsyncMock(return_value=mock_response)
-        mock_page.content = AsyncMock(return_value="<html></html>")
-        new_ctx.page = mock_page
-
+        new_ctx = _make_new_context()
         mock_pool.evict_and_replace = AsyncMock(return_value=new_ctx)
         mock_pool.acquire_context = AsyncMock(return_value=new_ctx)
 
@@ -241,43 +250,37 @@ class TestScrapeEndpoint:
         assert data["context_id"] == "ctx-new"
         mock_pool.evict_and_replace.assert_called_once()
 
-    async def test_scrape_context_released_after_error(
-        self, client, mock_pool, mock_context
+    @pytest.mark.parametrize(
+        (
+            "goto_error",
+            "initial_consecutive",
+            "expected_errors",
+            "expected_consecutive",
+        ),
+        [
+            pytest.param(None, 3, 0, 0, id="success-resets-consecutive"),
+            pytest.param(Exception("Error"), 0, 1, 1, id="error-increments"),
+        ],
+    )
+    async def test_scrape_error_tracking(
+        self,
+        client,
+        mock_pool,
+        mock_context,
+        goto_error,
+        initial_consecutive,
+        expected_errors,
+        expected_consecutive,
     ):
-        """Should release context even after error."""
-        mock_context.page.goto = AsyncMock(side_effect=Exception("Error"))
-
-        await client.post(
-            "/scrape",
-            json={"url": "https://example.com"},
-        )
-
-        mock_pool.release_context.assert_called_once_with("ctx-123")
-
-
-class TestScrapeErrorTracking:
-    """Tests for error tracking in scrape endpoint."""
-
-    async def test_records_success(self, client, mock_pool, mock_context):
-        """Should reset consecutive errors on success."""
-        mock_context.consecutive_errors = 3
-
-        await client.post(
-            "/scrape",
-            json={"url": "https://example.com"},
-        )
-
-        # After success, consecutive_errors should be reset
-        assert mock_context.consecutive_errors == 0
-
-    async def test_records_error(self, client, mock_pool, mock_context):
-        """Should increment error counters on failure."""
-        mock_context.page.goto = AsyncMock(side_effect=Exception("Error"))
+        """Should update the context's error counters from the scrape outcome."""
+        mock_context.consecutive_errors = initial_consecutive
+        if goto_error is not None:
+            mock_context.page.goto = AsyncMock(side_effect=goto_error)
 
         await client.post(
             "/scrape",
             json={"url": "https://example.com"},
         )
 
-        assert mock_context.error_count == 1
-        assert mock_context.consecutive_errors == 1
+        assert mock_context.error_count == expected_errors
+        assert mock_context.consecutive_errors == expected_consecutive